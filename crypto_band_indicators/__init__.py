@@ -32,16 +32,28 @@ from crypto_band_indicators.backtrader import (BandIndicatorWrapper,
                                                CryptoStrategy, DCAStrategy,
                                                HodlStrategy, RebalanceStrategy,
                                                WeightedDCAStrategy,)
-from crypto_band_indicators.datas import (DataSourceBase, FngDataSource,
-                                          PandasDataFactory, TickerDataSource,)
+from crypto_band_indicators.datas import (BinanceDataSource, DataSourceBase,
+                                          DataSourceCache, DataSourceRegistry,
+                                          FngDataSource, MultiTickerDataSource,
+                                          PandasDataFactory, SharedDataHandle,
+                                          SharedDataStore, TaWorkerPool,
+                                          TickerDataSource, get_binance_client,
+                                          iter_binance_kline_pages,
+                                          parse_binance_klines,)
 from crypto_band_indicators.indicators import (BandDetails, BandIndicatorBase,
+                                               BandIndicatorRegistry,
                                                FngBandIndicator,
                                                RainbowBandIndicator,)
 
-__all__ = ['BandDetails', 'BandIndicatorBase', 'BandIndicatorWrapper',
+__all__ = ['BandDetails', 'BandIndicatorBase', 'BandIndicatorRegistry',
+           'BandIndicatorWrapper', 'BinanceDataSource',
            'CheatOnOpenCryptoStrategy', 'CryptoStrategy', 'DCAStrategy',
-           'DataSourceBase', 'FngBandIndicator', 'FngDataSource',
-           'HodlStrategy', 'PandasDataFactory', 'RainbowBandIndicator',
-           'RebalanceStrategy', 'TickerDataSource', 'WeightedDCAStrategy',
-           'backtrader', 'config', 'datas', 'indicators', 'utils']
+           'DataSourceBase', 'DataSourceCache', 'DataSourceRegistry',
+           'FngBandIndicator', 'FngDataSource', 'HodlStrategy',
+           'MultiTickerDataSource', 'PandasDataFactory',
+           'RainbowBandIndicator', 'RebalanceStrategy', 'SharedDataHandle',
+           'SharedDataStore', 'TaWorkerPool', 'TickerDataSource',
+           'WeightedDCAStrategy', 'backtrader', 'config', 'datas',
+           'get_binance_client', 'indicators', 'iter_binance_kline_pages',
+           'parse_binance_klines', 'utils']
 # </AUTOGEN_INIT>
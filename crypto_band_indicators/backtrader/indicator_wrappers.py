@@ -1,7 +1,14 @@
+from array import array
+import numpy as np
 import backtrader as bt
 from crypto_band_indicators.indicators import BandIndicatorBase
 
 
+def _num2datetime64(date_nums: array) -> np.ndarray:
+    # backtrader date numbers count days from 0001-01-01 (= 1.0), like date.toordinal()
+    return np.datetime64('0001-01-01', 'D') + (np.floor(np.asarray(date_nums)).astype(np.int64) - 1)
+
+
 class BandIndicatorWrapper(bt.Indicator):
     lines = ('band_index', )
 
@@ -18,6 +25,15 @@ class BandIndicatorWrapper(bt.Indicator):
     def next(self):
         self.lines.band_index[0] = self.band_indicator.get_band_at(price=self.data.close[0], at_date=self.data.datetime.date())
 
+    def once(self, start, end):
+        # runonce mode: classify the whole range of the feed in one batch (dates out of the indicator data -> NaN)
+        band_index = self.band_indicator.get_band_index_array(
+            prices=np.asarray(self.data.close.array[start:end]),
+            at_dates=_num2datetime64(self.data.datetime.array[start:end]))
+
+        band_index = np.where(band_index >= 0, band_index, np.nan)
+        self.lines.band_index.array[start:end] = array('d', band_index.tobytes())
+
     def __str__(self):
         return str(self.band_indicator)
 
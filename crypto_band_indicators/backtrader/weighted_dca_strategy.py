@@ -4,7 +4,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from ..utils import LogColors, Emojis, PlotColors
-from ..indicators import BandIndicatorBase
+from ..indicators import BandIndicatorBase, BandIndicatorRegistry
 from .indicator_wrappers import BandIndicatorWrapper
 from .base_strategy import CryptoStrategy
 
@@ -24,9 +24,11 @@ class WeightedDCAStrategy(CryptoStrategy):
         if not issubclass(self.params.indicator_class, BandIndicatorBase):
             raise Exception('WeightedDCAStrategy.__init__: parameter indicator_class must be a subclass of BandIndicatorBase')
 
-        # Create indicator dinamically with indicator_class and indicator_ta_config
+        # Create indicator dinamically with indicator_class and indicator_ta_config (shared between strategy instances)
         if self.params.indicator_ta_config is None: self.params.indicator_ta_config = {}
-        self.indicator = BandIndicatorWrapper(band_indicator=self.params.indicator_class(ta_config=self.params.indicator_ta_config))
+        self.indicator = BandIndicatorWrapper(
+            band_indicator=BandIndicatorRegistry.get(self.params.indicator_class,
+                                                     ta_config=self.params.indicator_ta_config))
 
         self.price = self.data.close
 
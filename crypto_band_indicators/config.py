@@ -7,12 +7,30 @@ DISABLE_FETCH = 'disable_fetch'
 ONLY_CACHE = 'only_cache'
 ENABLE_BACKTRADER_LOG = 'enable_backtrader_log'
 ENABLE_BACKTRADER_DEBUG = 'enable_backtrader_debug'
+ALTERNATIVE_API_URL = 'alternative_api_url'
+HTTP_CONNECT_TIMEOUT = 'http_connect_timeout'
+HTTP_READ_TIMEOUT = 'http_read_timeout'
+HTTP_MAX_RETRIES = 'http_max_retries'
+HTTP_BACKOFF_FACTOR = 'http_backoff_factor'
+DATA_SOURCE_CACHE_MAX_MB = 'data_source_cache_max_mb'
+TA_WORKERS = 'ta_workers'
+TA_COLUMNS_CACHE_MAX_MB = 'ta_columns_cache_max_mb'
+COMPACT_DTYPES = 'compact_dtypes'
 
 __conf = {
     DISABLE_FETCH: strtobool(os.environ.get('DISABLE_FETCH', '0')),
     ONLY_CACHE: strtobool(os.environ.get('ONLY_CACHE', '0')),
     ENABLE_BACKTRADER_LOG: strtobool(os.environ.get('ENABLE_BACKTRADER_LOG', '0')),
     ENABLE_BACKTRADER_DEBUG: strtobool(os.environ.get('ENABLE_BACKTRADER_DEBUG', '0')),
+    ALTERNATIVE_API_URL: os.environ.get('ALTERNATIVE_API_URL', 'https://api.alternative.me'),
+    HTTP_CONNECT_TIMEOUT: float(os.environ.get('HTTP_CONNECT_TIMEOUT', '5')),    # seconds
+    HTTP_READ_TIMEOUT: float(os.environ.get('HTTP_READ_TIMEOUT', '30')),         # seconds
+    HTTP_MAX_RETRIES: int(os.environ.get('HTTP_MAX_RETRIES', '3')),              # retries on 5xx errors and timeouts
+    HTTP_BACKOFF_FACTOR: float(os.environ.get('HTTP_BACKOFF_FACTOR', '0.5')),    # seconds, doubled on every retry
+    DATA_SOURCE_CACHE_MAX_MB: float(os.environ.get('DATA_SOURCE_CACHE_MAX_MB', '512')),  # in-process cache of data sources (0: disabled)
+    TA_WORKERS: int(os.environ.get('TA_WORKERS', '0')),                          # processes calculating TA columns (0: serial, -1: one per cpu)
+    TA_COLUMNS_CACHE_MAX_MB: float(os.environ.get('TA_COLUMNS_CACHE_MAX_MB', '256')),  # in-process cache of TA columns (0: disabled)
+    COMPACT_DTYPES: strtobool(os.environ.get('COMPACT_DTYPES', '0')),            # smaller dtypes for loaded data (ie: uint8, category, float32)
 }
 
 def get(name, default = None):
@@ -1,10 +1,21 @@
 __private__ = ['alternative']
 
 # <AUTOGEN_INIT>
+from .binance_data_source import (BinanceDataSource, get_binance_client,
+                                  iter_binance_kline_pages,
+                                  parse_binance_klines,)
 from .data_source_base import (DataSourceBase, PandasDataFactory,)
+from .data_source_cache import (DataSourceCache,)
+from .data_source_registry import (DataSourceRegistry,)
 from .fng_data_source import (FngDataSource,)
+from .multi_ticker_data_source import (MultiTickerDataSource,)
+from .shared_data_store import (SharedDataHandle, SharedDataStore,)
+from .ta_worker_pool import (TaWorkerPool,)
 from .ticker_data_source import (TickerDataSource,)
 
-__all__ = ['DataSourceBase', 'FngDataSource', 'PandasDataFactory',
-           'TickerDataSource']
+__all__ = ['BinanceDataSource', 'DataSourceBase', 'DataSourceCache',
+           'DataSourceRegistry', 'FngDataSource', 'MultiTickerDataSource',
+           'PandasDataFactory', 'SharedDataHandle', 'SharedDataStore',
+           'TaWorkerPool', 'TickerDataSource', 'get_binance_client',
+           'iter_binance_kline_pages', 'parse_binance_klines']
 # </AUTOGEN_INIT>
@@ -3,14 +3,81 @@ Alternative.me API wrapper
 """
 import requests
 import time
+import json
+import random
 import datetime
 import typing
 from typing import Union, Optional, List, Dict
+from wrapt import synchronized
+from .. import config
 Timestamp = Union[datetime.datetime, datetime.date, int, float]
 requests.packages.urllib3.disable_warnings()
 
-# API:
-_URL_ALTERNATIVE_FNG = 'https://api.alternative.me/fng/?limit={}'
+# API (base url from config.ALTERNATIVE_API_URL):
+_URL_ALTERNATIVE_FNG = '{}/fng/?limit={}'
+
+# Pooled keep-alive session shared by all the requests, and last responses to make conditional requests
+_session = None
+_last_responses = dict()
+
+
+class _RetryableError(Exception):
+    pass
+
+
+@synchronized
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.verify = False
+        _session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=10))
+        _session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=10))
+
+    return _session
+
+
+def _get_response_content(url: str) -> bytes:
+    """
+    GET the url with the pooled session, retrying with exponential backoff (and jitter) on 5xx errors and timeouts.
+    Sends the ETag / Last-Modified of the last response of the url and reuses its content if not modified (304)
+    :param url: the url
+    :returns: response content
+    """
+    max_retries = config.get(config.HTTP_MAX_RETRIES, 3)
+    timeout = (config.get(config.HTTP_CONNECT_TIMEOUT), config.get(config.HTTP_READ_TIMEOUT))
+
+    headers = dict()
+    last_response = _last_responses.get(url)
+    if last_response is not None:
+        if last_response.get('etag'):
+            headers['If-None-Match'] = last_response['etag']
+        if last_response.get('last_modified'):
+            headers['If-Modified-Since'] = last_response['last_modified']
+
+    for attempt in range(max_retries + 1):
+        try:
+            response = _get_session().get(url, headers=headers, timeout=timeout)
+            if response.status_code >= 500:
+                raise _RetryableError(f"HTTP {response.status_code}")
+            break
+        except (_RetryableError, requests.Timeout, requests.ConnectionError):
+            if attempt >= max_retries:
+                raise
+            time.sleep(config.get(config.HTTP_BACKOFF_FACTOR) * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    if response.status_code == 304 and last_response is not None:
+        return last_response['content']
+
+    response.raise_for_status()
+
+    _last_responses[url] = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'content': response.content,
+    }
+
+    return response.content
 
 
 def _query_alternative(url: str, errorCheck: bool = True) -> Optional[Dict]:
@@ -21,10 +88,9 @@ def _query_alternative(url: str, errorCheck: bool = True) -> Optional[Dict]:
     :returns: response, or nothing if errorCheck=True and the response contains errors
     """
     try:
-        response = requests.get(url, verify=False).json()
+        response = json.loads(_get_response_content(url))
     except Exception as e:
         print(f"[ERROR] Unexpected error calling Alternative API. {str(e)}")
-        time.sleep(2)
         return None
 
     if errorCheck and (response.get('metadata', {}).get('error')):
@@ -66,7 +132,7 @@ def get_fng_history(limit: int = 10) -> Union[List, None]:
     :returns: list of indexes
     """
     alternative_response = _query_alternative(
-        _URL_ALTERNATIVE_FNG.format(_format_parameter(limit)))
+        _URL_ALTERNATIVE_FNG.format(config.get(config.ALTERNATIVE_API_URL), _format_parameter(limit)))
     if alternative_response:
         fng_list = typing.cast(List, alternative_response['data'])
         fng_list.reverse()
@@ -84,7 +150,7 @@ def get_fng_latest() -> Union[Dict, None]:
     :returns: list of indexes
     """
     alternative_response = _query_alternative(
-        _URL_ALTERNATIVE_FNG.format(_format_parameter(1)))
+        _URL_ALTERNATIVE_FNG.format(config.get(config.ALTERNATIVE_API_URL), _format_parameter(1)))
     if alternative_response:
         fng_list = typing.cast(List, alternative_response['data'])
         if (len(fng_list) > 0):
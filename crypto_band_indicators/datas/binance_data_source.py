@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import Iterator, List, Union
+from traceback import format_exc
+import numpy as np
+import pandas as pd
+from binance.client import Client
+from datetime import datetime, date
+from .data_source_base import DataSourceBase
+from ..utils import parse_any_date
+
+_KLINES_PAGE_LIMIT = 1000   # max klines per request allowed by Binance
+
+
+def get_binance_client(binance_api_key: str = None, binance_secret_key: str = None) -> Client:
+    client = Client(binance_api_key, binance_secret_key)
+
+    if not binance_api_key or not binance_secret_key:
+        client.API_URL = 'https://testnet.binance.vision/api'
+
+    return client
+
+
+def parse_binance_klines(klines: List) -> pd.DataFrame:
+    # Columnar conversion of a page of klines: open time (int64 ms) to datetime64, OHLCV to float64
+    open_times = np.fromiter((kline[0] for kline in klines), dtype=np.int64, count=len(klines))
+    ohlcv = np.array([kline[1:6] for kline in klines], dtype=np.float64)
+
+    return pd.DataFrame(ohlcv,
+                        columns=['open', 'high', 'low', 'close', 'volume'],
+                        index=pd.DatetimeIndex(open_times.astype('datetime64[ms]').astype('datetime64[ns]'), name='date'))
+
+
+def iter_binance_kline_pages(client: Client, ticker_symbol: str, granularity: str, start: datetime, end: Union[datetime, None] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream the klines of a symbol from start to end (default: now), one parsed page (up to 1000 klines) at a time
+    :param client: Binance client
+    :param ticker_symbol: symbol. Ex: 'BTCUSDT'
+    :param granularity: kline interval. Ex: '1d', '1h', '1m'
+    :param start: start date
+    :param end: end date (default: now)
+    :returns: generator of DataFrames with columns open, high, low, close and volume indexed by open time
+    """
+    start_time = int(pd.Timestamp(start).timestamp() * 1000)
+    end_time = int(pd.Timestamp(end).timestamp() * 1000) if end is not None else None
+
+    while True:
+        klines = client.get_klines(symbol=ticker_symbol, interval=granularity,
+                                   startTime=start_time, endTime=end_time, limit=_KLINES_PAGE_LIMIT)
+        if not klines:
+            return
+
+        yield parse_binance_klines(klines)
+
+        if len(klines) < _KLINES_PAGE_LIMIT:
+            return
+
+        # Next page starts after the open time of the last kline
+        start_time = klines[-1][0] + 1
+
+
+class BinanceDataSource(DataSourceBase):
+    index_column = 'date'
+    numeric_columns = ['open', 'high', 'low', 'close', 'volume']
+    publish_lag_days = 1        # last daily kline is closed the next day (intraday klines: see _get_cache_freshness)
+    granularity = '1d'
+    fetch_writes_cache = True
+
+    def __init__(self, ticker_symbol: str = 'BTCUSDT', binance_api_key: str = None, binance_secret_key: str = None, granularity: Union[str, None] = None):
+        super().__init__()
+        self.ticker_symbol = ticker_symbol
+        if granularity is not None:
+            self.granularity = granularity
+        self.binance_api_key = binance_api_key
+        self.binance_secret_key = binance_secret_key
+        self.cache_file_path = f"{ticker_symbol.lower()}_{self.granularity}_binance.csv"
+
+    def fetch_data(self, start: Union[str, date, datetime, None] = None) -> None:
+        # Klines are written in the cache page by page (not kept in memory), load() reads them from the cache
+        start = parse_any_date(start, datetime(2017, 1, 1))
+
+        # Only closed klines: the current one is still changing
+        last_open = pd.Timestamp.utcnow().tz_localize(None) - pd.Timedelta(self.get_bar_timedelta())
+        if (pd.Timestamp(start) > last_open):
+            return None
+
+        written_pages = 0
+        try:
+            client = get_binance_client(self.binance_api_key, self.binance_secret_key)
+
+            # An interrupted backfill continues from the last page written
+            for page in iter_binance_kline_pages(client, self.ticker_symbol, self.granularity, start):
+                page = page[page.index <= last_open]
+                if page.empty:
+                    continue
+
+                self.append_cache(page, compact=False)
+                written_pages += 1
+
+        except Exception:
+            print(f"Error fetching and parsing binance data... {format_exc()}")
+
+        # Segments of the pages merged once
+        if written_pages > 0:
+            self.compact_cache()
+
+        return None
@@ -1,29 +1,66 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple, Union
+from typing import Callable, Dict, List, Tuple, Union
+import os
+import json
+import time
+import hashlib
+from glob import glob
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
 import pandas_ta as ta
 import backtrader as bt
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 from .. import utils, config
 from wrapt import synchronized
+from .data_source_cache import DataSourceCache
+from .ta_worker_pool import TaWorkerPool
+from .shared_data_store import SharedDataHandle, SharedDataStore
 
 class PandasDataFactory():
+    _feed_classes = dict()
+
     @classmethod
     def create_feed(cls, additional_lines, **kvargs):
         # Default PandasData if no additional lines needed
         if additional_lines is None or len(additional_lines) == 0:
             return bt.feeds.PandasData(**kvargs)
 
+        return cls.get_feed_class(additional_lines)(**kvargs)
+
+    @synchronized
+    @classmethod
+    def get_feed_class(cls, additional_lines):
+        additional_lines = tuple(additional_lines)
+        if additional_lines in cls._feed_classes:
+            return cls._feed_classes[additional_lines]
+
         # Extend PandasData with addition_lines (lines must be declared at the class level in backtrader)
         # Ref: https://community.backtrader.com/topic/837/programmatically-extending-a-datafeed
         class_extensions = dict(
-            lines=tuple(additional_lines),
+            lines=additional_lines,
             params=tuple([(line, None) for line in additional_lines]),
         )
 
-        extended_class = type('ExtendedPandasData', (bt.feeds.PandasData,), class_extensions)
-        return extended_class(**kvargs)
+        # One class per lines, named after them and set in this module: it can be pickled (ie: optstrategy with maxcpus > 1)
+        class_name = f"{_EXTENDED_PANDAS_DATA_PREFIX}{','.join(additional_lines).encode().hex()}"
+        extended_class = type(class_name, (bt.feeds.PandasData,), class_extensions)
+        extended_class.__module__ = __name__
+        extended_class.__qualname__ = class_name
+        globals()[class_name] = extended_class
+
+        cls._feed_classes[additional_lines] = extended_class
+        return extended_class
+
+_EXTENDED_PANDAS_DATA_PREFIX = 'ExtendedPandasData_'
+_MAX_CACHE_SEGMENTS = 9999  # segment numbers have 4 digits (see get_cache_file_path)
+
+def __getattr__(name):
+    # Feed classes not created yet in this process (ie: unpickled in a new worker process)
+    if name.startswith(_EXTENDED_PANDAS_DATA_PREFIX):
+        return PandasDataFactory.get_feed_class(bytes.fromhex(name[len(_EXTENDED_PANDAS_DATA_PREFIX):]).decode().split(','))
+
+    raise AttributeError(f"module {__name__} has no attribute {name}")
 
 def _get_ta_ma_strategy(configs):
     return ta.Strategy(
@@ -31,15 +68,41 @@ def _get_ta_ma_strategy(configs):
         ta=configs
 )
 
+def _get_ta_config_key(ta_config: Dict) -> Tuple:
+    # Normalised config, ie: {'length': 3, 'kind': 'SMA'} and {'kind': 'sma', 'length': 3} are the same column
+    return tuple(sorted((key, value.lower() if key == 'kind' and isinstance(value, str) else value) for key, value in ta_config.items()))
+
+def _get_ta_kwargs_key(ta_kwargs: Dict) -> Tuple:
+    # pandas_ta strategy kwargs (ie: timed, verbose), as text: values may not be hashable
+    return tuple(sorted((key, repr(value)) for key, value in ta_kwargs.items()))
+
 class DataSourceBase():
-    cache_file_path = None
+    cache_file_path = None          # csv file path, also used as base name of the binary cache
+    cache_format = 'npz'            # 'npz' (binary, no parsing needed) or 'csv'
+    cache_compaction_segments = 30  # number of appended segment files merged into the main cache file
+    cache_lock_timeout = 60         # seconds after which the compaction lock of a cache is considered stale
     index_column = 'date'
     numeric_columns = []
     cache_date_format = '%Y-%m-%d'
+    cache_datetime_format = '%Y-%m-%d %H:%M:%S'     # cache date format of intraday granularities
+    granularity = '1d'              # bar size (Binance interval names): '1m', '15m', '1h', '4h', '1d', '1w'...
+    publish_hour_utc = 0            # hour (UTC) when the provider publishes the data of a new day
+    publish_lag_days = 0            # days from a date to the publication of its data (ie: 1 if published the next day)
+    fetch_ttl = 3600                # seconds to wait before fetching again a cache that is not fresh yet
+    fetch_writes_cache = False      # fetch_data appends the fetched rows to the cache itself (ie: streamed pages), load reads them from it
+    compact_dtypes = {}             # smaller dtype by column (ie: {'close': 'uint8'}) applied by compact() if COMPACT_DTYPES
+    _cache_listeners = []
+    _ta_columns_cache = OrderedDict()   # TA columns by (data fingerprint, config), see append_ta_columns
+    _ta_data_fingerprints = dict()      # data fingerprint of every data source using the TA columns cache
+    _not_shared_attributes = {'_resampled': dict}
+    _compact_warnings = set()           # (class, column) already warned by compact()
     
     def __init__(self):
         self.dataframe = None
         self.ta_columns = []
+        self._ta_config_keys = []
+        self._resampled = dict()
+        self.compact_report = None  # memory usage before / after compact()
 
     @synchronized
     def load(self) -> DataSourceBase:
@@ -48,25 +111,54 @@ class DataSourceBase():
         missing_start_date = None
         errors = list()
 
-        # Load cached csv data
+        # Load cached data (parsed once per process while the cache files don't change)
         try:
-            cached_data = self.read_cache()
+            cached_data = DataSourceCache.read_cache(self)
 
             last_date_cached = cached_data.index.max() if isinstance(
                 cached_data, pd.DataFrame) else None
             if last_date_cached:
-                missing_start_date = last_date_cached.date() + timedelta(days=1)
+                missing_start_date = (last_date_cached + self.get_bar_timedelta()).to_pydatetime()
         except Exception as e:
             errors.append(f"Error reading cache: {str(e)}")
             cached_data = None
 
         # Fetch API data
-        if not config.get(config.DISABLE_FETCH) and not (config.get(config.ONLY_CACHE) and isinstance(cached_data, pd.DataFrame)):
+        fetched_at = None
+        cache_freshness = self._get_cache_freshness(cached_data) if isinstance(cached_data, pd.DataFrame) else None
+        if (config.get(config.DISABLE_FETCH) or config.get(config.ONLY_CACHE)) and isinstance(cached_data, pd.DataFrame):
+            self._notify_cache_event('hit', reason='config')
+        elif config.get(config.DISABLE_FETCH):
+            # Nothing cached and nothing to fetch: load fails
+            self._notify_cache_event('miss', reason='fetch_disabled')
+        elif cache_freshness is not None:
+            self._notify_cache_event('hit', reason=cache_freshness)
+        else:
+            self._notify_cache_event('miss', reason='stale' if isinstance(cached_data, pd.DataFrame) else 'no_cache', start=missing_start_date)
+            fetch_started_at = datetime.now(timezone.utc)
+            fetch_failed = False
             try:
                 missing_data = self.fetch_data(start=missing_start_date)
             except Exception as e:
                 errors.append(f"Error fetching data: {str(e)}")
                 missing_data = None
+                fetch_failed = True
+
+            if self.fetch_writes_cache:
+                # Fetched rows are in the cache already (also the pages written before an error)
+                missing_data = None
+                try:
+                    cached_data = DataSourceCache.read_cache(self)
+                except Exception as e:
+                    errors.append(f"Error reading cache: {str(e)}")
+                    fetch_failed = True
+                fetched_rows = isinstance(cached_data, pd.DataFrame) and (missing_start_date is None or cached_data.index.max() >= missing_start_date)
+            else:
+                fetched_rows = isinstance(missing_data, pd.DataFrame) and not missing_data.empty
+
+            # Fetched again on next load (not waiting for fetch_ttl) if the fetch failed or got nothing new
+            if fetched_rows and not fetch_failed:
+                fetched_at = fetch_started_at
 
         # Validate data
         if not isinstance(cached_data, pd.DataFrame) and not isinstance(missing_data, pd.DataFrame):
@@ -76,49 +168,305 @@ class DataSourceBase():
             else:
                 raise Exception(f"{type(self).__name__}: Something went wrong loading the data...")
 
-        # Concatenate data
-        all_data = pd.concat([cached_data, missing_data])
-
-        if (all_data.empty):
-            raise Exception(f"{type(self).__name__}: No data available...")
+        # Concatenate data and fill missing time series: only after the part of the cache known to be contiguous
+        contiguous_until = self._get_cache_contiguous_until(cached_data)
+        if contiguous_until is None:
+            self.dataframe = pd.concat([cached_data, missing_data])
+            if (self.dataframe.empty):
+                raise Exception(f"{type(self).__name__}: No data available...")
+            self.fill_the_gaps()
+        elif not isinstance(missing_data, pd.DataFrame) and contiguous_until >= cached_data.index.max():
+            self.dataframe = cached_data
+        else:
+            boundary_row = cached_data.index.searchsorted(contiguous_until)
+            self.dataframe = pd.concat([cached_data.iloc[:boundary_row],
+                                        self._get_data_without_gaps(pd.concat([cached_data.iloc[boundary_row:], missing_data]))])
+
+        # Write cache if there is something to write: only the new rows if there is a cache already.
+        # The whole cache is rewritten if gaps were filled in the cached rows (ie: written by fetch_data):
+        # contiguous_until must be true for the stored rows
+        cache_gaps_filled = isinstance(cached_data, pd.DataFrame) and \
+            self.dataframe.index.searchsorted(cached_data.index.max(), side='right') != len(cached_data)
+        if not isinstance(cached_data, pd.DataFrame) or cache_gaps_filled:
+            self.write_cache()
+        elif self.dataframe.index.max() > cached_data.index.max():
+            self.append_cache(self.dataframe.iloc[self.dataframe.index.searchsorted(cached_data.index.max(), side='right'):])
 
-        # Register data
-        self.dataframe = all_data
+        metadata = dict()
+        if fetched_at is not None:
+            metadata.update(fetched_at=fetched_at.isoformat())
+        if contiguous_until is None or self.dataframe.index.max() > contiguous_until:
+            metadata.update(contiguous_until=self.dataframe.index.max().isoformat())
+        if len(metadata) > 0:
+            self.write_cache_metadata(**metadata)
 
-        # Fill missing time series
-        self.fill_the_gaps()
+        if config.get(config.COMPACT_DTYPES):
+            self.compact_report = self.compact()
 
-        # Write cache if there is something to write
-        if not isinstance(cached_data, pd.DataFrame) or all_data.index.max() > cached_data.index.max():
-            self.write_cache()
+        # TA columns cached for the previous data of this source are not needed anymore
+        if self._get_ta_source_key() in DataSourceBase._ta_data_fingerprints:
+            DataSourceBase._set_ta_data_fingerprint(self._get_ta_source_key(), self._get_data_fingerprint(self.dataframe))
 
         return self
 
+    def compact(self) -> Dict[str, int]:
+        """
+        Convert the columns of compact_dtypes to their smaller dtype. Integer dtypes round the values (ie: interpolated gaps),
+        columns with values that don't fit (out of range, NaN) are converted to float32 instead
+        :returns: memory usage (deep, bytes) of the dataframe before and after
+        """
+        self._validate_dataframe()
+
+        memory_usage_before = self.get_memory_usage()
+        columns = dict()
+        for column, dtype in self.compact_dtypes.items():
+            if column not in self.dataframe.columns or self.dataframe[column].dtype == dtype:
+                continue
+
+            if dtype != 'category' and np.issubdtype(np.dtype(dtype), np.integer):
+                values = np.rint(self.dataframe[column].to_numpy(dtype=float))
+                dtype_info = np.iinfo(dtype)
+                if np.isfinite(values).all() and values.min(initial=dtype_info.min) >= dtype_info.min and values.max(initial=dtype_info.max) <= dtype_info.max:
+                    columns[column] = pd.Series(values.astype(dtype), index=self.dataframe.index, name=column)
+                    continue
+
+                # Warned once per process
+                if (type(self), column) not in DataSourceBase._compact_warnings:
+                    DataSourceBase._compact_warnings.add((type(self), column))
+                    print(f"[warn] {type(self).__name__}: values of column {column} don't fit in {dtype}, compacted to float32")
+                dtype = 'float32'
+
+            columns[column] = self.dataframe[column].astype(dtype)
+
+        if len(columns) > 0:
+            dataframe = self.dataframe.copy(deep=False)
+            for column, values in columns.items():
+                dataframe[column] = values
+            self.dataframe = dataframe
+
+        return {'before': memory_usage_before, 'after': self.get_memory_usage()}
+
+    def get_memory_usage(self) -> int:
+        # Bytes of the dataframe, index and text / categorical values included
+        self._validate_dataframe()
+
+        return int(self.dataframe.memory_usage(index=True, deep=True).sum())
+
+    def _get_cache_freshness(self, cached_data: pd.DataFrame) -> Union[str, None]:
+        # 'fresh' if the cache has the last date published by the provider, 'ttl' if it was fetched less than fetch_ttl seconds ago
+        now = datetime.now(timezone.utc)
+        if self.is_intraday():
+            # Last closed bar: the one before the current bar
+            bar_timedelta = pd.Timedelta(self.get_bar_timedelta())
+            if cached_data.index.max() >= pd.Timestamp(now).tz_localize(None).floor(bar_timedelta) - bar_timedelta:
+                return 'fresh'
+        else:
+            last_published_date = (now - timedelta(hours=self.publish_hour_utc)).date() - timedelta(days=self.publish_lag_days)
+            if cached_data.index.max().date() >= last_published_date:
+                return 'fresh'
+
+        fetched_at = self.read_cache_metadata().get('fetched_at')
+        if fetched_at is not None and (now - datetime.fromisoformat(fetched_at)).total_seconds() < self.fetch_ttl:
+            return 'ttl'
+
+        return None
+
+    def _get_cache_contiguous_until(self, cached_data: Union[pd.DataFrame, None]) -> Union[pd.Timestamp, None]:
+        # Last date of the cache without gaps (filled when it was loaded), see load()
+        if not isinstance(cached_data, pd.DataFrame):
+            return None
+
+        contiguous_until = self.read_cache_metadata().get('contiguous_until')
+        if contiguous_until is None or pd.Timestamp(contiguous_until) < cached_data.index.min():
+            return None
+
+        return min(pd.Timestamp(contiguous_until), cached_data.index.max())
+
+    def read_cache_metadata(self) -> Dict:
+        try:
+            with open(self.get_cache_file_path('meta.json')) as metadata_file:
+                return json.load(metadata_file)
+        except Exception:
+            return dict()
+
+    def write_cache_metadata(self, **values) -> None:
+        metadata = self.read_cache_metadata()
+        metadata.update(values)
+
+        def write_metadata(file_path: str) -> None:
+            with open(file_path, 'w') as metadata_file:
+                json.dump(metadata, metadata_file)
+
+        utils.write_file_atomically(self.get_cache_file_path('meta.json'), write_metadata)
+
+    @classmethod
+    def add_cache_listener(cls, listener: Callable[[str, str, Dict], None]) -> None:
+        # listener(data_source_name, event, details) is called on every cache 'hit' / 'miss' of any data source
+        DataSourceBase._cache_listeners.append(listener)
+
+    @classmethod
+    def remove_cache_listener(cls, listener: Callable[[str, str, Dict], None]) -> None:
+        DataSourceBase._cache_listeners.remove(listener)
+
+    def _notify_cache_event(self, event: str, **details) -> None:
+        for listener in DataSourceBase._cache_listeners:
+            listener(type(self).__name__, event, details)
+
     def fetch_data(self):
         pass
 
+    def get_bar_timedelta(self) -> np.timedelta64:
+        return utils.get_granularity_timedelta(self.granularity)
+
+    def is_intraday(self) -> bool:
+        return self.get_bar_timedelta() < np.timedelta64(1, 'D')
+
+    def get_cache_date_format(self) -> str:
+        return self.cache_datetime_format if self.is_intraday() else self.cache_date_format
+
     def write_cache(self) -> None:
         self._validate_dataframe()
 
-        local_cache_file_path = self.__class__.cache_file_path if self.__class__.cache_file_path else f"{type(self).__name__}.csv"
-        local_index_column = self.__class__.index_column if self.__class__.index_column else 'date'
-        self.dataframe.to_csv(local_cache_file_path, sep=';',
-                              date_format=self.cache_date_format, index=True, index_label=local_index_column)
+        # Rewrite the whole cache: main file with all the data and no segments
+        self._write_cache_file(self.dataframe, self.get_cache_file_path())
+        self._remove_cache_segments(self._get_cache_segment_file_paths())
+
+        # The new data may have gaps (set again by load once filled)
+        if self.read_cache_metadata().get('contiguous_until') is not None:
+            self.write_cache_metadata(contiguous_until=None)
+
+    def append_cache(self, new_data: pd.DataFrame, compact: bool = True) -> None:
+        """
+        Write new rows in the cache without rewriting it
+        :param new_data: rows after the last cached date
+        :param compact: merge the segments into the main file every cache_compaction_segments. If False (ie: many
+            pages streamed by fetch_data) the caller calls compact_cache() once at the end
+        """
+        if not os.path.exists(self.get_cache_file_path()):
+            self._write_cache_file(new_data, self.get_cache_file_path())
+            if self.read_cache_metadata().get('contiguous_until') is not None:
+                self.write_cache_metadata(contiguous_until=None)
+            return
+
+        # Write only the new rows in a new segment file. Created exclusively: if another process took the
+        # segment number, try the next one
+        segment_file_paths = self._get_cache_segment_file_paths()
+        segment_number = int(segment_file_paths[-1].split('.')[-2]) + 1 if len(segment_file_paths) > 0 else 1
+        while True:
+            try:
+                self._write_cache_file(new_data, self.get_cache_file_path(segment_number=segment_number), exclusive=True)
+                break
+            except FileExistsError:
+                segment_number += 1
+
+        if len(segment_file_paths) + 1 >= (self.cache_compaction_segments if compact else _MAX_CACHE_SEGMENTS):
+            self.compact_cache()
+
+    def compact_cache(self) -> None:
+        segment_file_paths = self._get_cache_segment_file_paths()
+        if len(segment_file_paths) == 0:
+            return
+
+        # One process compacts at a time (the others keep their segments for the next compaction)
+        lock_file_path = self.get_cache_file_path('lock')
+        try:
+            os.close(os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_file_path) < self.cache_lock_timeout:
+                    return
+                # Stale lock (ie: process killed while compacting)
+                os.utime(lock_file_path)
+            except FileNotFoundError:
+                return
+
+        try:
+            # Replace the main file first: if it fails before removing the segments, their rows are just duplicated
+            self._write_cache_file(self.read_cache(), self.get_cache_file_path())
+            self._remove_cache_segments(segment_file_paths)
+        finally:
+            os.remove(lock_file_path)
+
+    def _remove_cache_segments(self, segment_file_paths: List[str]) -> None:
+        # Segments may be removed already by another process compacting the same cache
+        for segment_file_path in segment_file_paths:
+            try:
+                os.remove(segment_file_path)
+            except FileNotFoundError:
+                pass
 
     def read_cache(self) -> Union[pd.DataFrame, None]:
-        local_cache_file_path = self.__class__.cache_file_path if self.__class__.cache_file_path else f"{type(self).__name__}.csv"
+        local_cache_file_path = self.get_cache_file_path()
+        if not os.path.exists(local_cache_file_path) and self.cache_format != 'csv':
+            # Migrate the csv cache (if any) to the binary format
+            cached_data = self.import_csv()
+            if isinstance(cached_data, pd.DataFrame):
+                self._write_cache_file(cached_data, local_cache_file_path)
+            return cached_data
+
+        cached_data = [self._read_cache_file(local_cache_file_path)]
+        for segment_file_path in self._get_cache_segment_file_paths():
+            try:
+                cached_data.append(self._read_cache_file(segment_file_path))
+            except FileNotFoundError:
+                # Merged into the main file by another process meanwhile (see compact_cache): read it again
+                return self.read_cache()
+
+        cached_data = pd.concat(cached_data) if len(cached_data) > 1 else cached_data[0]
+        if not isinstance(cached_data, pd.DataFrame) or cached_data.empty:
+            return None
+
+        return cached_data[~cached_data.index.duplicated(keep='last')]
+
+    def get_cache_file_path(self, cache_format: Union[str, None] = None, segment_number: Union[int, None] = None) -> str:
+        local_cache_file_path = self.cache_file_path if self.cache_file_path else f"{type(self).__name__}.csv"
+        cache_format = cache_format if cache_format is not None else self.cache_format
+
+        if segment_number is not None:
+            return f"{os.path.splitext(local_cache_file_path)[0]}.{segment_number:04d}.{cache_format}"
+
+        return f"{os.path.splitext(local_cache_file_path)[0]}.{cache_format}"
+
+    def _get_cache_segment_file_paths(self) -> List[str]:
+        return sorted(glob(f"{os.path.splitext(self.get_cache_file_path())[0]}.[0-9][0-9][0-9][0-9].{self.cache_format}"))
+
+    def _write_cache_file(self, data: pd.DataFrame, file_path: str, exclusive: bool = False) -> None:
+        # Write in a unique temporary file and rename it: readers never see a partially written file
+        if self.cache_format == 'csv':
+            utils.write_file_atomically(file_path, lambda temporary_file_path: self._write_csv(data, temporary_file_path), exclusive=exclusive)
+        else:
+            utils.write_file_atomically(file_path, lambda temporary_file_path: self._write_npz(data, temporary_file_path), exclusive=exclusive)
+
+    def _read_cache_file(self, file_path: str) -> Union[pd.DataFrame, None]:
+        if self.cache_format == 'csv':
+            return self.import_csv(file_path)
+
+        return self._read_npz(file_path)
+
+    def export_csv(self, file_path: Union[str, None] = None) -> None:
+        self._validate_dataframe()
+
+        self._write_csv(self.dataframe, file_path if file_path else self.get_cache_file_path('csv'))
+
+    def _write_csv(self, data: pd.DataFrame, file_path: str) -> None:
+        local_index_column = self.index_column if self.index_column else 'date'
+        data.to_csv(file_path, sep=';',
+                    date_format=self.get_cache_date_format(), index=True, index_label=local_index_column)
+
+    def import_csv(self, file_path: Union[str, None] = None) -> Union[pd.DataFrame, None]:
+        local_cache_file_path = file_path if file_path else self.get_cache_file_path('csv')
         cached_data = pd.read_csv(local_cache_file_path, sep=';')
         
         if not isinstance(cached_data, pd.DataFrame) or cached_data.empty:
             return None
 
-        local_index_column = self.__class__.index_column if self.__class__.index_column else 'date'
-        local_numeric_columns = self.__class__.numeric_columns if isinstance(
-            self.__class__.numeric_columns, list) else list()
+        local_index_column = self.index_column if self.index_column else 'date'
+        local_numeric_columns = self.numeric_columns if isinstance(
+            self.numeric_columns, list) else list()
 
         # Convert column types and discard invalid data
         cached_data[local_index_column] = pd.to_datetime(
-            cached_data[local_index_column], format=self.cache_date_format)
+            cached_data[local_index_column], format=self.get_cache_date_format())
 
         for local_numeric_column in local_numeric_columns:
             cached_data[local_numeric_column] = pd.to_numeric(
@@ -132,6 +480,43 @@ class DataSourceBase():
 
         return cached_data
 
+    def _write_npz(self, data: pd.DataFrame, file_path: str) -> None:
+        # One array per column (dtypes kept) + the index as int64 (ns), no pickled objects.
+        # Text and categorical columns (ie: close_name) are stored as codes of their unique values
+        arrays = dict()
+        for column in data.columns:
+            if data[column].dtype == object or isinstance(data[column].dtype, pd.CategoricalDtype):
+                codes, uniques = pd.factorize(data[column])
+                arrays[f"codes:{column}"] = codes.astype(np.int32)
+                arrays[f"uniques:{column}"] = np.array(uniques, dtype=str)
+            else:
+                arrays[f"column:{column}"] = data[column].to_numpy()
+
+        with open(file_path, 'wb') as cache_file:
+            np.savez(cache_file,
+                     date=data.index.to_numpy(dtype='datetime64[ns]').view(np.int64),
+                     columns=np.array(data.columns, dtype=str),
+                     **arrays)
+
+    def _read_npz(self, file_path: str) -> Union[pd.DataFrame, None]:
+        with np.load(file_path, allow_pickle=False) as cache:
+            if len(cache['date']) == 0:
+                return None
+
+            columns = dict()
+            for column in cache['columns']:
+                if f"codes:{column}" in cache.files:
+                    codes = cache[f"codes:{column}"]
+                    uniques = cache[f"uniques:{column}"].astype(object)
+                    columns[column] = np.where(codes >= 0, uniques[codes] if len(uniques) > 0 else None, None)
+                else:
+                    columns[column] = cache[f"column:{column}"]
+
+            local_index_column = self.index_column if self.index_column else 'date'
+            index = pd.DatetimeIndex(cache['date'].view('datetime64[ns]'), name=local_index_column)
+
+            return pd.DataFrame(columns, index=index)
+
     def to_dataframe(self, start: Union[str, date, datetime, None] = None, end: Union[str, date, datetime, None] = None) -> pd.DataFrame:
         self._validate_dataframe()
 
@@ -174,19 +559,115 @@ class DataSourceBase():
 
         if not isinstance(ta_configs, list):
             ta_configs = [ta_configs]
-        
-        # Drop existing ta columns
-        if self.ta_columns is not None and len(self.ta_columns) > 0:
-            self.dataframe = self.dataframe.drop(columns=self.ta_columns)
-            self.ta_columns = list()
-        
-        self.dataframe.ta.cores = 0     # Disable multiprocessing (conflicts with backtrader)
-        self.dataframe.ta.strategy(_get_ta_ma_strategy(ta_configs), **kwargs)
+
+        # Same configs (and kwargs) as the ta columns in the dataframe: nothing to do
+        ta_kwargs_key = _get_ta_kwargs_key(kwargs)
+        ta_config_keys = [(_get_ta_config_key(ta_config), ta_kwargs_key) for ta_config in ta_configs]
+        if ta_config_keys == self._ta_config_keys and len(self.ta_columns) > 0 and set(self.ta_columns).issubset(self.dataframe.columns):
+            return self
+
+        # Columns of every config, computed once per config and data (fingerprint of the data without ta columns)
+        data = self.dataframe.drop(columns=self.ta_columns, errors='ignore') if len(self.ta_columns) > 0 else self.dataframe
+        data_fingerprint = self._get_data_fingerprint(data)
+
+        cache_keys = [(data_fingerprint, ta_config_key) for ta_config_key in ta_config_keys]
+        cached_ta_columns = DataSourceBase._get_cached_ta_columns(self._get_ta_source_key(), data_fingerprint, cache_keys)
+        missing_ta_configs = {cache_key: ta_config for cache_key, ta_config in zip(cache_keys, ta_configs)
+                              if cache_key not in cached_ta_columns}
+
+        # Independent configs calculated in parallel by the package process pool if enabled (TA_WORKERS)
+        if len(missing_ta_configs) > 1 and TaWorkerPool.get_max_workers() > 1:
+            missing_ta_columns = TaWorkerPool.calculate_ta_columns(data, list(missing_ta_configs.values()), **kwargs)
+        else:
+            missing_ta_columns = [self._calculate_ta_columns(data, ta_config, **kwargs) for ta_config in missing_ta_configs.values()]
+        calculated_ta_columns = dict(zip(missing_ta_configs.keys(), missing_ta_columns))
+
+        DataSourceBase._set_cached_ta_columns(calculated_ta_columns)
+
+        ta_columns = OrderedDict()
+        for cache_key in cache_keys:
+            ta_columns.update(calculated_ta_columns[cache_key] if cache_key in calculated_ta_columns else cached_ta_columns[cache_key])
+
+        # Replace existing ta columns
+        self.dataframe = data.copy(deep=False)
+        for ta_column, ta_values in ta_columns.items():
+            self.dataframe[ta_column] = ta_values
 
         # Save columns to be retrieve in get_ta_columns
-        self.ta_columns.extend(self.dataframe.columns[-len(ta_configs):])
-        
+        self.ta_columns = list(ta_columns.keys())
+        self._ta_config_keys = ta_config_keys
+
         return self
+
+    def _get_ta_source_key(self) -> Tuple:
+        return (type(self), os.path.abspath(self.get_cache_file_path()))
+
+    @synchronized
+    @classmethod
+    def _get_cached_ta_columns(cls, source_key: Tuple, data_fingerprint: str, cache_keys: List[Tuple]) -> Dict[Tuple, Dict[str, np.ndarray]]:
+        # Cached columns of cache_keys (most recently used now). Columns of the previous data of the source are released
+        DataSourceBase._set_ta_data_fingerprint(source_key, data_fingerprint)
+
+        cached_ta_columns = dict()
+        for cache_key in cache_keys:
+            if cache_key in DataSourceBase._ta_columns_cache:
+                DataSourceBase._ta_columns_cache.move_to_end(cache_key)
+                cached_ta_columns[cache_key] = DataSourceBase._ta_columns_cache[cache_key]
+
+        return cached_ta_columns
+
+    @synchronized
+    @classmethod
+    def _set_cached_ta_columns(cls, calculated_ta_columns: Dict[Tuple, Dict[str, np.ndarray]]) -> None:
+        max_bytes = config.get(config.TA_COLUMNS_CACHE_MAX_MB) * 1024 * 1024
+        if max_bytes <= 0:
+            return
+
+        # Least recently used configs evicted beyond TA_COLUMNS_CACHE_MAX_MB (the last one is always kept)
+        DataSourceBase._ta_columns_cache.update(calculated_ta_columns)
+        cached_bytes = sum(cls._get_ta_columns_bytes(ta_columns) for ta_columns in DataSourceBase._ta_columns_cache.values())
+        while cached_bytes > max_bytes and len(DataSourceBase._ta_columns_cache) > 1:
+            _, evicted_ta_columns = DataSourceBase._ta_columns_cache.popitem(last=False)
+            cached_bytes -= cls._get_ta_columns_bytes(evicted_ta_columns)
+
+    @synchronized
+    @classmethod
+    def _set_ta_data_fingerprint(cls, source_key: Tuple, data_fingerprint: str) -> None:
+        # Columns of a replaced fingerprint (ie: the source was loaded again) are released if no other source uses it
+        replaced_fingerprint = DataSourceBase._ta_data_fingerprints.get(source_key)
+        DataSourceBase._ta_data_fingerprints[source_key] = data_fingerprint
+        if replaced_fingerprint is None or replaced_fingerprint == data_fingerprint or \
+                replaced_fingerprint in DataSourceBase._ta_data_fingerprints.values():
+            return
+
+        for cache_key in [cache_key for cache_key in DataSourceBase._ta_columns_cache.keys() if cache_key[0] == replaced_fingerprint]:
+            del DataSourceBase._ta_columns_cache[cache_key]
+
+    @classmethod
+    def _get_ta_columns_bytes(cls, ta_columns: Dict[str, np.ndarray]) -> int:
+        return sum(ta_values.nbytes for ta_values in ta_columns.values())
+
+    def _calculate_ta_columns(self, data: pd.DataFrame, ta_config: Dict, **kwargs) -> Dict[str, np.ndarray]:
+        # New columns identified by name: the ones not in data before running the strategy
+        ta_data = data.copy(deep=False)
+        ta_data.ta.cores = 0     # Disable multiprocessing (conflicts with backtrader)
+        ta_data.ta.strategy(_get_ta_ma_strategy([ta_config]), **kwargs)
+
+        ta_columns = dict()
+        for column in ta_data.columns.difference(data.columns, sort=False):
+            ta_columns[column] = ta_data[column].to_numpy()
+            ta_columns[column].flags.writeable = False
+
+        return ta_columns
+
+    def _get_data_fingerprint(self, data: pd.DataFrame) -> str:
+        fingerprint = hashlib.sha1(data.index.to_numpy(dtype='datetime64[ns]').tobytes())
+        for column in data.columns:
+            if pd.api.types.is_numeric_dtype(data[column].dtype):
+                fingerprint.update(f"{column}|{data[column].dtype}".encode())
+                fingerprint.update(data[column].to_numpy().tobytes())
+
+        return fingerprint.hexdigest()
     
     # @synchronized
     def get_ta_columns(self) -> List(str):
@@ -195,8 +676,13 @@ class DataSourceBase():
     def fill_the_gaps(self, start: datetime = None, end: datetime = None) -> DataSourceBase:
         self._validate_dataframe()
 
-        min = self.dataframe.index.min()
-        max = self.dataframe.index.max()
+        self.dataframe = self._get_data_without_gaps(self.dataframe, start, end)
+
+        return self
+
+    def _get_data_without_gaps(self, data: pd.DataFrame, start: datetime = None, end: datetime = None) -> pd.DataFrame:
+        min = data.index.min()
+        max = data.index.max()
 
         # Filter index range
         if start is not None:
@@ -204,41 +690,99 @@ class DataSourceBase():
         if end is not None:
             max = end if end < max else max
 
-        # start=min, end=max, freq="D"
-        all_dates_range = pd.date_range(min, max)
-        # print('missing_dates in self.dataframe: ', all_dates_range.difference(self.dataframe.index))
-
-        self.dataframe = self.dataframe.reindex(
-            all_dates_range, fill_value=np.nan).interpolate()
+        all_dates_range = pd.date_range(min, max, freq=pd.Timedelta(self.get_bar_timedelta()))
+        # print('missing_dates in data: ', all_dates_range.difference(data.index))
 
-        return self
+        return data.reindex(all_dates_range, fill_value=np.nan).interpolate()
 
     def get_filtered_by_dates(self, start: datetime = None, end: datetime = None) -> pd.DataFrame:
         self._validate_dataframe()
 
-        min = start if start is not None else self.dataframe.index.min()
-        max = end if end is not None else self.dataframe.index.max()
+        if not self.dataframe.index.is_monotonic_increasing:
+            min = start if start is not None else self.dataframe.index.min()
+            max = end if end is not None else self.dataframe.index.max()
+            return self.dataframe[(self.dataframe.index >= min) & (self.dataframe.index <= max)]
+
+        # Binary search on the sorted index: positional slice, a view of the dataframe (no copy)
+        start_row = self.dataframe.index.searchsorted(start, side='left') if start is not None else 0
+        end_row = self.dataframe.index.searchsorted(end, side='right') if end is not None else len(self.dataframe)
+        return self.dataframe.iloc[start_row:end_row]
+
+    def resample(self, granularity: str) -> pd.DataFrame:
+        """
+        Bars of a coarser granularity (ie: daily or weekly bars of an hourly / minute data source), memoized
+        until the dataframe changes. Open / high / low / close / volume columns are aggregated as first / max / min / last / sum,
+        other columns take the last value of each bar. Aggregations run over the rows of each bar with ufunc.reduceat,
+        no intermediate copy of the data is made
+        :param granularity: bar size (Binance interval names). Ex: '1d', '1w'
+        :returns: DataFrame indexed by the open date of the bars
+        """
+        self._validate_dataframe()
+
+        bar_timedelta = utils.get_granularity_timedelta(granularity)
+        if bar_timedelta < self.get_bar_timedelta() or bar_timedelta % self.get_bar_timedelta() != np.timedelta64(0):
+            raise Exception(f"{type(self).__name__}: can't resample bars of {self.granularity} into bars of {granularity}")
+
+        data_key = (id(self.dataframe), len(self.dataframe), self.dataframe.index[-1])
+        if granularity in self._resampled and self._resampled[granularity][0] == data_key:
+            return self._resampled[granularity][1]
+
+        # Open date of every bar (weekly bars open on monday) and first row of each bar by binary search
+        timestamps = self.dataframe.index.to_numpy(dtype='datetime64[ns]')
+        origin = np.datetime64('1970-01-05', 'ns') if bar_timedelta % np.timedelta64(7, 'D') == np.timedelta64(0) else np.datetime64(0, 'ns')
+        first_open, last_open = origin + (timestamps[[0, -1]] - origin) // bar_timedelta * bar_timedelta
+        bar_opens = np.arange(first_open, last_open + bar_timedelta, bar_timedelta)
+        bar_starts = np.searchsorted(timestamps, bar_opens)
+        bar_ends = np.append(bar_starts[1:], len(timestamps))
+
+        # Skip bars without rows (gaps)
+        not_empty = bar_starts < bar_ends
+        bar_opens, bar_starts, bar_ends = bar_opens[not_empty], bar_starts[not_empty], bar_ends[not_empty]
+
+        aggregations = {
+            'open': lambda values: values[bar_starts],
+            'high': lambda values: np.fmax.reduceat(values, bar_starts),
+            'low': lambda values: np.fmin.reduceat(values, bar_starts),
+            'volume': lambda values: np.add.reduceat(values, bar_starts),
+        }
+        resampled = pd.DataFrame({column: aggregations.get(column, lambda values: values[bar_ends - 1])(self.dataframe[column].to_numpy())
+                                  for column in self.dataframe.columns},
+                                 index=pd.DatetimeIndex(bar_opens, name=self.dataframe.index.name))
 
-        return self.dataframe[(self.dataframe.index >= min) & (self.dataframe.index <= max)]
+        self._resampled[granularity] = (data_key, resampled)
+        return resampled
 
     def get_value_start_end(self, start: Union[str, date, datetime, None] = None, end: Union[str, date, datetime, None] = None, column_name: str = 'close') -> Tuple(float):
         self._validate_dataframe()
 
-        # Get start index
-        start_index = utils.parse_any_date(start)
-        if not start_index:
-            start_index = self.dataframe.index.min()
-
-        # Get end index
-        end_index = utils.parse_any_date(end)
-        if not end_index:
-            end_index = self.dataframe.index.max()
-
-        rwa_serie_start = self.dataframe[self.dataframe.index ==
-                                         pd.to_datetime(start_index)]
-        rwa_serie_end = self.dataframe[self.dataframe.index == pd.to_datetime(
-            end_index)]
-        return (float(rwa_serie_start[column_name]), float(rwa_serie_end[column_name]))
+        # Rows are contiguous bars (see fill_the_gaps): row = offset in bars from the first date
+        start_row = self._get_row_at(utils.parse_any_date(start), default_row=0)
+        end_row = self._get_row_at(utils.parse_any_date(end), default_row=len(self.dataframe) - 1)
+
+        column_values = self.dataframe[column_name]
+        return (float(column_values.iat[start_row]), float(column_values.iat[end_row]))
+
+    def _get_row_at(self, at_date: Union[date, datetime, None], default_row: int) -> int:
+        if not at_date:
+            return default_row
+
+        row_at = int(utils.get_bar_offsets(at_date, self.dataframe.index[0], self.get_bar_timedelta()))
+        if row_at < 0 or row_at >= len(self.dataframe):
+            raise IndexError(
+                f"{type(self).__name__}: date {at_date:%Y-%m-%d} out of the data range [{self.dataframe.index[0]:%Y-%m-%d}, {self.dataframe.index[-1]:%Y-%m-%d}]")
+
+        return row_at
+
+    def publish_shared(self) -> SharedDataHandle:
+        # Publish the dataframe (and TA columns) once in shared memory for worker processes, see attach_shared
+        self._validate_dataframe()
+
+        return SharedDataStore.publish_object(self)
+
+    @classmethod
+    def attach_shared(cls, handle: SharedDataHandle) -> DataSourceBase:
+        # Loaded data source over read-only views of the published data (no copies, no cache read)
+        return SharedDataStore.attach_object(handle)
 
     def _validate_dataframe(self):
         if not isinstance(self.dataframe, pd.DataFrame):
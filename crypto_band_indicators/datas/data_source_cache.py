@@ -0,0 +1,101 @@
+from __future__ import annotations
+from typing import Dict, Tuple, Union
+import os
+from collections import OrderedDict
+import pandas as pd
+from wrapt import synchronized
+from .. import config
+
+
+class DataSourceCache():
+    # Process level cache of the data read from the cache files, by data source class and cache file path.
+    # Entries are valid while the cache files don't change (mtime / size), least recently used ones are evicted
+    # beyond DATA_SOURCE_CACHE_MAX_MB. Frames are handed out with read-only arrays: shared data can't be modified
+    _entries = OrderedDict()
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def read_cache(cls, data_source) -> Union[pd.DataFrame, None]:
+        max_bytes = config.get(config.DATA_SOURCE_CACHE_MAX_MB) * 1024 * 1024
+        if max_bytes <= 0:
+            return data_source.read_cache()
+
+        key = (type(data_source), os.path.abspath(data_source.get_cache_file_path()))
+        signature = cls.get_signature(data_source)
+
+        entry = cls._get_entry(key, signature)
+        if entry is not None:
+            return pd.DataFrame(entry['arrays'], index=entry['index'], copy=False)
+
+        # Parsed without the lock: data sources of other cache files are read concurrently (see DataSourceRegistry.load_all)
+        cached_data = data_source.read_cache()
+        # No signature before reading: the cache file didn't exist yet (ie: migrated from csv), not shared until next read
+        if not isinstance(cached_data, pd.DataFrame) or signature is None:
+            return cached_data
+
+        arrays = dict()
+        for column in cached_data.columns:
+            arrays[column] = cached_data[column].to_numpy()
+            arrays[column].flags.writeable = False
+
+        cls._set_entry(key, {
+            'signature': signature,
+            'arrays': arrays,
+            'index': cached_data.index,
+            'size': sum(array.nbytes for array in arrays.values()) + cached_data.index.nbytes,
+        }, max_bytes)
+
+        return pd.DataFrame(arrays, index=cached_data.index, copy=False)
+
+    @synchronized
+    @classmethod
+    def _get_entry(cls, key: Tuple, signature: Union[Tuple, None]) -> Union[Dict, None]:
+        entry = cls._entries.get(key)
+        if entry is not None and signature is not None and entry['signature'] == signature:
+            cls.hits += 1
+            cls._entries.move_to_end(key)
+            return entry
+
+        cls.misses += 1
+        cls._entries.pop(key, None)
+        return None
+
+    @synchronized
+    @classmethod
+    def _set_entry(cls, key: Tuple, entry: Dict, max_bytes: float) -> None:
+        cls._entries[key] = entry
+        cls._entries.move_to_end(key)
+        cls._evict(max_bytes)
+
+    @synchronized
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries = OrderedDict()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        return {'entries': len(cls._entries), 'bytes': sum(entry['size'] for entry in cls._entries.values()), 'hits': cls.hits, 'misses': cls.misses}
+
+    @classmethod
+    def _evict(cls, max_bytes: int) -> None:
+        # Least recently used first, the last entry is always kept
+        total_bytes = sum(entry['size'] for entry in cls._entries.values())
+        while total_bytes > max_bytes and len(cls._entries) > 1:
+            _, entry = cls._entries.popitem(last=False)
+            total_bytes -= entry['size']
+
+    @classmethod
+    def get_signature(cls, data_source) -> Union[Tuple, None]:
+        # mtime / size of the main cache file and its segments (see DataSourceBase.append_cache)
+        signature = list()
+        for file_path in [data_source.get_cache_file_path()] + data_source._get_cache_segment_file_paths():
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                return None
+            signature.append((file_path, file_stat.st_mtime_ns, file_stat.st_size))
+
+        return tuple(signature)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple, Type, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .data_source_base import DataSourceBase
+
+
+class DataSourceRegistry():
+    _data_source_classes = list()
+
+    @classmethod
+    def register(cls, data_source_class: Type[DataSourceBase]) -> Type[DataSourceBase]:
+        # Can be used as class decorator
+        if data_source_class not in cls._data_source_classes:
+            cls._data_source_classes.append(data_source_class)
+
+        return data_source_class
+
+    @classmethod
+    def get_registered(cls) -> List[Type[DataSourceBase]]:
+        return list(cls._data_source_classes)
+
+    @classmethod
+    def load_all(cls, data_sources: Union[List[Union[Type[DataSourceBase], DataSourceBase]], None] = None, max_workers: Union[int, None] = None) -> Tuple[Dict, Dict]:
+        """
+        Load data sources concurrently (one thread each) and return when all of them are done.
+        :param data_sources: data source classes or instances to load (default: all registered classes)
+        :param max_workers: maximum number of threads (default: one per data source)
+        :returns: (loaded, errors): dicts by item of data_sources with the loaded instance or the exception raised.
+                  One data source failing doesn't cancel the others
+        """
+        if data_sources is None:
+            data_sources = cls.get_registered()
+
+        loaded = dict()
+        errors = dict()
+        if len(data_sources) == 0:
+            return loaded, errors
+
+        with ThreadPoolExecutor(max_workers=max_workers if max_workers else len(data_sources)) as executor:
+            futures = {executor.submit(cls._load, data_source): data_source for data_source in data_sources}
+
+            for future in as_completed(futures):
+                try:
+                    loaded[futures[future]] = future.result()
+                except Exception as e:
+                    print(f"[error] DataSourceRegistry.load_all: {str(e)}")
+                    errors[futures[future]] = e
+
+        return loaded, errors
+
+    @classmethod
+    def _load(cls, data_source: Union[Type[DataSourceBase], DataSourceBase]) -> DataSourceBase:
+        if isinstance(data_source, type):
+            data_source = data_source()
+
+        return data_source.load()
@@ -1,17 +1,22 @@
 from __future__ import annotations
 from typing import List, Tuple, Union
 from traceback import format_exc
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 from .alternative import get_fng_history
 from .data_source_base import DataSourceBase
+from .data_source_registry import DataSourceRegistry
 from ..utils import parse_any_date
 
 
+@DataSourceRegistry.register
 class FngDataSource(DataSourceBase):
     cache_file_path = 'fng_1d_alternative.csv'
     index_column = 'date'
     numeric_columns = ['close']
+    publish_hour_utc = 0
+    compact_dtypes = {'close': 'uint8', 'close_name': 'category'}     # index 0-100, five classification names
 
     def fetch_data(self, start: Union[str, date, datetime, None] = None) -> Union[pd.DataFrame, None]:
         start = parse_any_date(start, datetime(2010, 1, 1))
@@ -19,8 +24,6 @@ class FngDataSource(DataSourceBase):
         if (start.date() >= date.today()):
             return None
 
-        data = None
-
         try:
             if (start):
                 limit = (date.today() - start.date()).days + 1
@@ -28,34 +31,27 @@ class FngDataSource(DataSourceBase):
             else:
                 fng_response = get_fng_history(limit=0)
 
-            data = pd.DataFrame(fng_response, columns=[
-                'timestamp', 'value', 'value_classification'])
-
-            if not isinstance(data, pd.DataFrame) or data.empty:
-                return None
-
-            data = data.rename(
-                columns={'timestamp': 'date', 'value': 'close', 'value_classification': 'close_name'})
-
-            # Convert column types and discard invalid data
-            data['date'] = pd.to_datetime(data['date'].apply(
-                lambda x: datetime.fromtimestamp(int(x)).date()))
-            data['close'] = pd.to_numeric(
-                data['close'], errors='raise')
-            # Drop invalid rows
-            data = data[data["close"] > 0]
-
-            # Set index
-            data = data.set_index('date', drop=True)
-
-            # Remove non requested dates
-            if (start):
-                data = data[~(data.index < pd.to_datetime(start))]
-
-            return data
+            return self.parse_fng_history(fng_response, start=start)
 
         except Exception as e:
             print(f"Error fetching and parsing fng data... {format_exc()}")
             return None
 
+    @classmethod
+    def parse_fng_history(cls, fng_response: Union[List, None], start: Union[datetime, None] = None) -> Union[pd.DataFrame, None]:
+        if not fng_response:
+            return None
+
+        # Columnar conversion: one array per field, timestamps (UTC seconds) to dates in a single cast
+        timestamps = np.array([fng['timestamp'] for fng in fng_response]).astype(np.int64)
+        dates = timestamps.astype('datetime64[s]').astype('datetime64[D]').astype('datetime64[ns]')
+        close = np.array([fng['value'] for fng in fng_response]).astype(np.int64)
+        close_name = np.array([fng['value_classification'] for fng in fng_response], dtype=object)
+
+        # Drop invalid rows and non requested dates
+        valid_rows = close > 0
+        if start:
+            valid_rows &= dates >= np.datetime64(start, 'D')
 
+        return pd.DataFrame({'close': close[valid_rows], 'close_name': close_name[valid_rows]},
+                            index=pd.DatetimeIndex(dates[valid_rows], name='date'))
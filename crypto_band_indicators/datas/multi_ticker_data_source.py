@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import List, Union
+import numpy as np
+import pandas as pd
+from wrapt import synchronized
+from .binance_data_source import BinanceDataSource
+from .data_source_base import DataSourceBase
+from .data_source_registry import DataSourceRegistry
+from .. import utils, config
+
+
+class MultiTickerDataSource(DataSourceBase):
+    """
+    Close prices of several tickers aligned on one contiguous daily index.
+    Values are stored in a single 2-D float array (one row per symbol), the dataframe (one column per symbol)
+    and the per symbol arrays / series are views of it. Each symbol keeps its own cache file (see BinanceDataSource)
+    """
+    index_column = 'date'
+    value_column = 'close'
+
+    def __init__(self, ticker_symbols: List[str] = ['BTCUSDT'], binance_api_key: str = None, binance_secret_key: str = None, max_workers: Union[int, None] = None):
+        super().__init__()
+        self.ticker_symbols = list(ticker_symbols)
+        self.max_workers = max_workers
+        self.data_sources = [BinanceDataSource(ticker_symbol, binance_api_key, binance_secret_key) for ticker_symbol in self.ticker_symbols]
+        self.values = None
+
+    @synchronized
+    def load(self) -> MultiTickerDataSource:
+        # Fetch / read the cache of every symbol concurrently
+        loaded, errors = DataSourceRegistry.load_all(self.data_sources, max_workers=self.max_workers)
+        if len(errors) > 0:
+            failed_symbols = [data_source.ticker_symbol for data_source in errors.keys()]
+            raise Exception(f"{type(self).__name__}: Error loading {', '.join(failed_symbols)}")
+
+        dataframes = [data_source.dataframe for data_source in self.data_sources]
+        first_date = min(dataframe.index[0] for dataframe in dataframes)
+        last_date = max(dataframe.index[-1] for dataframe in dataframes)
+        dates = pd.date_range(first_date, last_date, name=self.index_column)
+
+        # Every symbol is already a contiguous daily range: copy it at its day offset (NaN before / after its range),
+        # float32 in compact mode
+        values_dtype = np.float32 if config.get(config.COMPACT_DTYPES) else np.float64
+        values = np.full((len(self.ticker_symbols), len(dates)), np.nan, dtype=values_dtype)
+        for values_row, dataframe in zip(values, dataframes):
+            start_row = int(utils.get_day_offsets(dataframe.index[0], first_date))
+            values_row[start_row:start_row + len(dataframe)] = dataframe[self.value_column].to_numpy(dtype=values_dtype)
+
+        # The per symbol dataframes are not needed anymore
+        for data_source in self.data_sources:
+            data_source.dataframe = None
+
+        self.values = values
+        self.dataframe = pd.DataFrame(values.T, index=dates, columns=self.ticker_symbols, copy=False)
+
+        return self
+
+    def get_symbol_values(self, ticker_symbol: str) -> np.ndarray:
+        self._validate_dataframe()
+
+        return self.values[self.ticker_symbols.index(ticker_symbol)]
+
+    def get_symbol_series(self, ticker_symbol: str) -> pd.Series:
+        return pd.Series(self.get_symbol_values(ticker_symbol), index=self.dataframe.index, name=ticker_symbol, copy=False)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import os
+import atexit
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import pandas as pd
+from wrapt import synchronized
+
+_ALIGNMENT = 64     # bytes, offset of every array in the shared memory block
+
+
+class SharedDataHandle():
+    """
+    Reference to the arrays of an object published in shared memory (see SharedDataStore.publish_object).
+    It is small and can be pickled: pass it to the worker processes and attach to the data with attach_object()
+    """
+
+    def __init__(self, name: str, object_class: type, layout: List[Tuple], attributes: Dict, dataframes: Dict):
+        self.name = name                    # shared memory block name
+        self.object_class = object_class
+        self.layout = layout                # (key, dtype, shape, offset) of every array
+        self.attributes = attributes        # other attributes of the object (pickled with the handle)
+        self.dataframes = dataframes        # columns / index name / categories of every dataframe attribute
+
+
+class SharedDataStore():
+    # Arrays of data sources and indicators published once in shared memory, attached read-only and without copies
+    # by worker processes (children of the publisher process). Published blocks are unlinked by release() or at exit
+    _published = dict()
+    _attached = dict()
+
+    @synchronized
+    @classmethod
+    def publish_object(cls, shared_object: any) -> SharedDataHandle:
+        """
+        Copy the numeric arrays and dataframes attributes of an object (ie: DataSourceBase, BandIndicatorBase) in a new shared memory block
+        :param shared_object: object to publish. Attributes in its _not_shared_attributes ({name: factory}) are not published
+        :returns: handle to attach to the object data from other processes
+        """
+        not_shared_attributes = getattr(shared_object, '_not_shared_attributes', dict())
+
+        arrays = dict()
+        attributes = dict()
+        dataframes = dict()
+        for attribute, value in vars(shared_object).items():
+            if attribute in not_shared_attributes or attribute == '_synchronized_lock':     # wrapt lock, created again on use
+                continue
+            elif isinstance(value, np.ndarray) and value.dtype != object:
+                arrays[f"array:{attribute}"] = value
+            elif isinstance(value, pd.DataFrame):
+                dataframes[attribute] = cls._get_dataframe_arrays(value, attribute, arrays)
+            else:
+                attributes[attribute] = value
+
+        layout = list()
+        size = 0
+        for key, array in arrays.items():
+            layout.append((key, array.dtype.str, array.shape, size))
+            size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        shared_memory = SharedMemory(create=True, size=max(size, 1))
+        for key, dtype, shape, offset in layout:
+            np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf, offset=offset)[...] = arrays[key]
+
+        cls._published[shared_memory.name] = (os.getpid(), shared_memory)
+        return SharedDataHandle(shared_memory.name, type(shared_object), layout, attributes, dataframes)
+
+    @synchronized
+    @classmethod
+    def attach_object(cls, handle: SharedDataHandle) -> any:
+        """
+        Create an instance of the published object class (without calling __init__) over read-only views of the shared arrays
+        :param handle: handle returned by publish_object
+        :returns: object with the same attributes as the published one
+        """
+        shared_memory = cls._published[handle.name][1] if handle.name in cls._published else cls._attached.get(handle.name)
+        if shared_memory is None:
+            shared_memory = SharedMemory(name=handle.name)
+            cls._attached[handle.name] = shared_memory
+
+        arrays = dict()
+        for key, dtype, shape, offset in handle.layout:
+            arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf, offset=offset)
+            arrays[key].flags.writeable = False
+
+        shared_object = handle.object_class.__new__(handle.object_class)
+        shared_object.__dict__.update(handle.attributes)
+        for attribute, factory in getattr(shared_object, '_not_shared_attributes', dict()).items():
+            setattr(shared_object, attribute, factory())
+        for key, array in arrays.items():
+            if key.startswith('array:'):
+                setattr(shared_object, key[len('array:'):], array)
+        for attribute, dataframe_layout in handle.dataframes.items():
+            setattr(shared_object, attribute, cls._get_dataframe(attribute, dataframe_layout, arrays))
+
+        return shared_object
+
+    @synchronized
+    @classmethod
+    def release(cls, handle: SharedDataHandle = None) -> None:
+        # Unlink published blocks (all if no handle): attached views in other processes stay valid until they exit.
+        # Only by the publisher process (forked workers inherit _published)
+        names = [handle.name] if handle is not None else list(cls._published.keys())
+        for name in names:
+            publisher_pid, shared_memory = cls._published.pop(name, (None, None))
+            if publisher_pid == os.getpid():
+                shared_memory.unlink()
+
+    @classmethod
+    def _get_dataframe_arrays(cls, dataframe: pd.DataFrame, attribute: str, arrays: Dict) -> Dict:
+        # Text columns are shared as codes, their unique values go with the handle
+        arrays[f"index:{attribute}"] = dataframe.index.to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+        categories = dict()
+        for column in dataframe.columns:
+            if isinstance(dataframe[column].dtype, pd.CategoricalDtype):
+                arrays[f"codes:{attribute}:{column}"] = dataframe[column].cat.codes.to_numpy()
+                categories[column] = (list(dataframe[column].cat.categories), True)
+            elif dataframe[column].dtype == object:
+                codes, uniques = pd.factorize(dataframe[column])
+                arrays[f"codes:{attribute}:{column}"] = codes.astype(np.int32)
+                categories[column] = (list(uniques), False)
+            else:
+                arrays[f"column:{attribute}:{column}"] = dataframe[column].to_numpy()
+
+        return {'columns': list(dataframe.columns), 'index_name': dataframe.index.name, 'categories': categories}
+
+    @classmethod
+    def _get_dataframe(cls, attribute: str, dataframe_layout: Dict, arrays: Dict) -> pd.DataFrame:
+        columns = dict()
+        for column in dataframe_layout['columns']:
+            if column in dataframe_layout['categories']:
+                uniques, is_categorical = dataframe_layout['categories'][column]
+                codes = arrays[f"codes:{attribute}:{column}"]
+                if is_categorical:
+                    columns[column] = pd.Categorical.from_codes(codes, categories=uniques)
+                else:
+                    columns[column] = np.array(uniques + [None], dtype=object)[codes]     # code -1: None
+            else:
+                columns[column] = arrays[f"column:{attribute}:{column}"]
+
+        index = pd.DatetimeIndex(arrays[f"index:{attribute}"].view('datetime64[ns]'), name=dataframe_layout['index_name'])
+        return pd.DataFrame(columns, index=index, copy=False)
+
+
+atexit.register(SharedDataStore.release)
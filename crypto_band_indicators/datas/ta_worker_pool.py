@@ -0,0 +1,121 @@
+from __future__ import annotations
+from typing import Dict, List, Tuple
+import os
+import atexit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import pandas as pd
+from wrapt import synchronized
+from .. import config
+
+# Data of the last call, copied once per worker process (see _calculate_ta_columns_worker)
+_worker_data = dict()
+
+
+def _get_worker_data(data_layout: Tuple) -> pd.DataFrame:
+    shared_memory_name, length, columns, index_name = data_layout
+    if shared_memory_name not in _worker_data:
+        _worker_data.clear()
+
+        shared_memory = SharedMemory(name=shared_memory_name)
+        shared_data = np.array(np.ndarray((len(columns) + 1, length), dtype=np.float64, buffer=shared_memory.buf))
+        shared_memory.close()
+
+        _worker_data[shared_memory_name] = pd.DataFrame(
+            {column: shared_data[row] for row, column in enumerate(columns, 1)},
+            index=pd.DatetimeIndex(shared_data[0].view('datetime64[ns]'), name=index_name), copy=False)
+
+    return _worker_data[shared_memory_name]
+
+
+def _calculate_ta_columns_worker(data_layout: Tuple, ta_config: Dict, kwargs: Dict) -> Tuple[str, List[str]]:
+    from .data_source_base import _get_ta_ma_strategy
+
+    data = _get_worker_data(data_layout)
+    ta_data = data.copy(deep=False)
+    ta_data.ta.cores = 0     # No nested multiprocessing
+    ta_data.ta.strategy(_get_ta_ma_strategy([ta_config]), **kwargs)
+
+    # Result columns in a new shared memory block, unlinked by the caller once read
+    ta_columns = list(ta_data.columns.difference(data.columns, sort=False))
+    result_memory = SharedMemory(create=True, size=max(1, 8 * len(ta_columns) * len(ta_data)))
+    np.ndarray((len(ta_columns), len(ta_data)), dtype=np.float64, buffer=result_memory.buf)[:] = ta_data[ta_columns].to_numpy(dtype=np.float64).T
+    result_memory.close()
+
+    return result_memory.name, ta_columns
+
+
+class TaWorkerPool():
+    # Process pool (spawn: no state inherited from the caller, ie: backtrader) managed by the package to calculate
+    # TA configs in parallel. Enabled with TA_WORKERS, data and results are passed through shared memory
+    _executor = None
+    _max_workers = 0
+
+    @classmethod
+    def get_max_workers(cls) -> int:
+        max_workers = int(config.get(config.TA_WORKERS, 0))
+        return (os.cpu_count() or 1) if max_workers < 0 else max_workers
+
+    @synchronized
+    @classmethod
+    def get_executor(cls) -> ProcessPoolExecutor:
+        max_workers = cls.get_max_workers()
+        if cls._executor is None or cls._max_workers != max_workers:
+            cls.shutdown()
+            cls._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'))
+            cls._max_workers = max_workers
+
+        return cls._executor
+
+    @synchronized
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+            cls._executor = None
+            cls._max_workers = 0
+
+    @classmethod
+    def calculate_ta_columns(cls, data: pd.DataFrame, ta_configs: List[Dict], **kwargs) -> List[Dict[str, np.ndarray]]:
+        """
+        Calculate every ta config in a worker process
+        :param data: data to calculate the ta columns from. Only numeric columns are passed to the workers (as float64)
+        :param ta_configs: pandas_ta configs. Ex: [{'kind': 'sma', 'length': 3}, {'kind': 'wma', 'length': 4}]
+        :returns: new columns of every ta config (read-only arrays by column name), in the order of ta_configs
+        """
+        executor = cls.get_executor()
+        columns = [column for column in data.columns if pd.api.types.is_numeric_dtype(data[column].dtype)]
+
+        # Index (int64 ns) in the first row and one row per column
+        shared_memory = SharedMemory(create=True, size=max(1, 8 * (len(columns) + 1) * len(data)))
+        try:
+            shared_data = np.ndarray((len(columns) + 1, len(data)), dtype=np.float64, buffer=shared_memory.buf)
+            shared_data[0].view(np.int64)[:] = data.index.to_numpy(dtype='datetime64[ns]').view(np.int64)
+            for row, column in enumerate(columns, 1):
+                shared_data[row] = data[column].to_numpy(dtype=np.float64)
+            del shared_data
+
+            data_layout = (shared_memory.name, len(data), columns, data.index.name)
+            futures = [executor.submit(_calculate_ta_columns_worker, data_layout, ta_config, kwargs) for ta_config in ta_configs]
+
+            return [cls._read_result(*future.result(), length=len(data)) for future in futures]
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    @classmethod
+    def _read_result(cls, result_memory_name: str, ta_columns: List[str], length: int) -> Dict[str, np.ndarray]:
+        result_memory = SharedMemory(name=result_memory_name)
+        try:
+            result_data = np.array(np.ndarray((len(ta_columns), length), dtype=np.float64, buffer=result_memory.buf))
+        finally:
+            result_memory.close()
+            result_memory.unlink()
+
+        result_data.flags.writeable = False
+        return {ta_column: result_data[row] for row, ta_column in enumerate(ta_columns)}
+
+
+atexit.register(TaWorkerPool.shutdown)
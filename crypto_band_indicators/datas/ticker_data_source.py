@@ -1,19 +1,22 @@
 from __future__ import annotations
-from binance.client import Client
 from typing import List, Tuple, Union
 from traceback import format_exc
 import pandas as pd
 import nasdaqdatalink
 from datetime import datetime, date, timedelta
+from .binance_data_source import get_binance_client, iter_binance_kline_pages
 from .data_source_base import DataSourceBase
+from .data_source_registry import DataSourceRegistry
 from ..utils import parse_any_date
 nasdaqdatalink.ApiConfig.verify_ssl = False
 
 
+@DataSourceRegistry.register
 class TickerDataSource(DataSourceBase):
     cache_file_path = 'btcusdt_1d_nasdaq.csv'
     index_column = 'date'
     numeric_columns = ['close']
+    publish_lag_days = 1
 
     def fetch_data(self, start: Union[str, date, datetime, None] = None) -> Union[pd.DataFrame, None]:
         start = parse_any_date(start, datetime(2010, 1, 1))
@@ -57,10 +60,7 @@ class TickerDataSource(DataSourceBase):
         
     @classmethod
     def get_binance_ticker_market_price(cls, ticker_symbol: str = 'BTCUSDT', binance_api_key: str = None, binance_secret_key: str = None):
-        client = Client(binance_api_key, binance_secret_key)
-
-        if not binance_api_key or not binance_secret_key:
-            client.API_URL = 'https://testnet.binance.vision/api'
+        client = get_binance_client(binance_api_key, binance_secret_key)
 
         return client.get_symbol_ticker(symbol=ticker_symbol)
 
@@ -69,31 +69,12 @@ class TickerDataSource(DataSourceBase):
         """
         Gets ticker price of a specific coin pair
         """
-        client = Client(binance_api_key, binance_secret_key)
-
-        if not binance_api_key or not binance_secret_key:
-            client.API_URL = 'https://testnet.binance.vision/api'
+        client = get_binance_client(binance_api_key, binance_secret_key)
 
-        target_date = (datetime.now() - timedelta(days=days)
-                       ).strftime("%d %b %Y %H:%M:%S")
         key = f"{ticker_symbol}"
-        end_date = datetime.now()
-        end_date = end_date.strftime("%d %b %Y %H:%M:%S")
-
-        coindata = pd.DataFrame(columns=[key])
-
-        prices = []
-        dates = []
-        for result in client.get_historical_klines(
-            ticker_symbol, granularity, target_date, end_date, limit=1000
-        ):
-            date = datetime.utcfromtimestamp(
-                result[0] / 1000).strftime("%d %b %Y %H:%M:%S")
-            price = float(result[1])
-            dates.append(date)
-            prices.append(price)
-
-        coindata[key] = prices
-        coindata['date'] = dates
-
-        return (coindata.reindex(columns=['date', key]))
+        pages = [page['open'] for page in iter_binance_kline_pages(client, ticker_symbol, granularity, datetime.now() - timedelta(days=days))]
+        prices = pd.concat(pages) if len(pages) > 0 else pd.Series(dtype=float, index=pd.DatetimeIndex([]))
+
+        coindata = pd.DataFrame({'date': prices.index.strftime("%d %b %Y %H:%M:%S"), key: prices.to_numpy()})
+
+        return coindata
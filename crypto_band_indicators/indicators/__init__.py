@@ -2,9 +2,10 @@
 
 # <AUTOGEN_INIT>
 from .band_indicator_base import (BandDetails, BandIndicatorBase,)
+from .band_indicator_registry import (BandIndicatorRegistry,)
 from .fng_band_indicator import (FngBandIndicator,)
 from .rainbow_band_indicator import (RainbowBandIndicator,)
 
-__all__ = ['BandDetails', 'BandIndicatorBase', 'FngBandIndicator',
-           'RainbowBandIndicator']
+__all__ = ['BandDetails', 'BandIndicatorBase', 'BandIndicatorRegistry',
+           'FngBandIndicator', 'RainbowBandIndicator']
 # </AUTOGEN_INIT>
@@ -1,5 +1,9 @@
 from typing import Union
+from datetime import datetime, date
+import numpy as np
 import pandas as pd
+from .. import utils
+from ..datas.shared_data_store import SharedDataHandle, SharedDataStore
 
 class BandDetails:
     band_index=0
@@ -20,6 +24,7 @@ class BandIndicatorBase:
     data = None
     data_column = 'close'  # select data column: ie: moving average data column
     ticker_symbol = 'BTCUSDT'
+    data_source_class = None    # data source loaded if no data is passed (see BandIndicatorRegistry)
     def __init__(self, data: Union[pd.DataFrame, None] = None, data_column: str = None, ticker_symbol: str = 'BTCUSDT', **kvargs):
         self.ticker_symbol = ticker_symbol
         self.data = None
@@ -41,12 +46,89 @@ class BandIndicatorBase:
                 print(f"[error] {error_message}")
                 raise Exception(error_message)
 
+    def _build_date_index(self):
+        dates = self.data.index.to_numpy(dtype='datetime64[D]')
+        self._first_date = dates[0]
+        self._last_date = dates[-1]
+        self._dates = None
+
+        # Data sources fill the gaps of the daily series, so the row of a date is its offset in days from the first date.
+        # Other data (ie: a caller-supplied frame with gaps) is looked up by date
+        if not np.array_equal(utils.get_day_offsets(dates, self._first_date), np.arange(len(dates))):
+            self._dates = pd.DatetimeIndex(dates)
+            if not self._dates.is_unique:
+                error_message = f"{type(self).__name__}: data index has duplicated dates"
+                print(f"[error] {error_message}")
+                raise Exception(error_message)
+
+    def _get_row_at(self, at_date: Union[date, datetime, None] = None) -> int:
+        if not at_date:
+            return len(self.data) - 1
+
+        row_at = int(self._get_rows_at(np.asarray([at_date], dtype='datetime64[D]'))[0])
+        if row_at < 0:
+            raise IndexError(f"date {at_date:%Y-%m-%d} not found in the data [{self._first_date}, {self._last_date}]")
+
+        return row_at
+
+    def _get_rows_at(self, at_dates: Union[pd.DatetimeIndex, np.ndarray]) -> np.ndarray:
+        # -1 for dates out of the data range (or not in the data if it has gaps)
+        if self._dates is not None:
+            return self._dates.get_indexer(pd.DatetimeIndex(np.asarray(at_dates, dtype='datetime64[D]'))).astype(np.int64)
+
+        rows_at = utils.get_day_offsets(at_dates, self._first_date)
+        rows_at[(rows_at < 0) | (rows_at >= len(self.data))] = -1
+
+        return rows_at
+
+    def get_memory_usage(self) -> int:
+        # Bytes of the data (deep: text / categorical values included) and the calculated arrays
+        data_memory_usage = int(self.data.memory_usage(index=True, deep=True).sum()) if isinstance(self.data, pd.DataFrame) else 0
+
+        return data_memory_usage + sum(value.nbytes for value in vars(self).values() if isinstance(value, np.ndarray))
+
+    def publish_shared(self) -> SharedDataHandle:
+        # Publish data and calculated arrays once in shared memory for worker processes, see attach_shared
+        return SharedDataStore.publish_object(self)
+
+    @classmethod
+    def attach_shared(cls, handle: SharedDataHandle):
+        # Indicator over read-only views of the published arrays (no data load, no calculations)
+        return SharedDataStore.attach_object(handle)
+
+    def _set_read_only(self):
+        # Shared instances (see BandIndicatorRegistry) can't be modified by their users
+        for attribute, value in list(vars(self).items()):
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            elif isinstance(value, pd.DataFrame):
+                # Same frame over read-only views of its numeric columns (no copy)
+                columns = dict()
+                for column in value.columns:
+                    columns[column] = value[column].to_numpy() if isinstance(value[column].dtype, np.dtype) else value[column].array
+                    if isinstance(columns[column], np.ndarray):
+                        columns[column].flags.writeable = False
+                setattr(self, attribute, pd.DataFrame(columns, index=value.index, copy=False))
+
     def get_band_at(self) -> Union[int, None]:
         pass
 
     def get_band_details_at(self) -> Union[BandDetails, None]:
         pass
 
+    def get_band_index_array(self, prices: Union[np.ndarray, None] = None, at_dates: Union[pd.DatetimeIndex, np.ndarray, None] = None, **kvargs) -> np.ndarray:
+        # Default for indicators only implementing get_band_at: one call per date (-1 if there is no band).
+        # Subclasses override it with a vectorized version
+        at_dates = pd.DatetimeIndex(at_dates if at_dates is not None else self.data.index)
+
+        band_index = np.full(len(at_dates), -1, dtype=np.int8)
+        for row, at_date in enumerate(at_dates.date):
+            band_index_at = self.get_band_at(price=float(prices[row]) if prices is not None else None, at_date=at_date)
+            if band_index_at is not None:
+                band_index[row] = band_index_at
+
+        return band_index
+
     def plot_axes(self):
         pass
 
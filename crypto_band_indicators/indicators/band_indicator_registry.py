@@ -0,0 +1,71 @@
+from typing import Dict, Type, Union
+from datetime import datetime, date
+from wrapt import synchronized
+from .. import utils
+from ..datas import DataSourceCache
+from .band_indicator_base import BandIndicatorBase
+
+
+def _get_hashable(value: any) -> any:
+    # Normalise dicts / lists (ie: ta_config) into sorted tuples to be used as keys
+    if isinstance(value, dict):
+        return tuple(sorted((key, _get_hashable(item)) for key, item in value.items()))
+    elif isinstance(value, (list, tuple)):
+        return tuple(_get_hashable(item) for item in value)
+
+    return value
+
+
+class BandIndicatorRegistry():
+    # Process level cache of indicator instances, shared by strategy instances (ie: optimisation runs with optstrategy).
+    # Instances are valid while the cache files of their data source don't change (ie: new data fetched)
+    _instances = dict()
+    hits = 0
+    misses = 0
+
+    @synchronized
+    @classmethod
+    def get(cls, indicator_class: Type[BandIndicatorBase], ta_config: Union[dict, None] = None, indicator_start_date: Union[str, date, datetime, None] = None, **kvargs) -> BandIndicatorBase:
+        indicator_kvargs = dict(ta_config=ta_config, indicator_start_date=indicator_start_date, **kvargs)
+
+        try:
+            key = (indicator_class,
+                   _get_hashable(ta_config or {}),
+                   utils.parse_any_date(indicator_start_date),
+                   _get_hashable(kvargs))
+            hash(key)
+        except TypeError:
+            # Not hashable arguments (ie: data passed as DataFrame): don't share the instance
+            cls.misses += 1
+            return indicator_class(**indicator_kvargs)
+
+        instance = cls._instances.get(key)
+        if instance is not None and instance['data_signature'] == cls._get_data_signature(indicator_class):
+            cls.hits += 1
+            return instance['indicator']
+
+        cls.misses += 1
+        indicator = indicator_class(**indicator_kvargs)
+        indicator._set_read_only()
+        cls._instances[key] = {'indicator': indicator, 'data_signature': cls._get_data_signature(indicator_class)}
+
+        return indicator
+
+    @synchronized
+    @classmethod
+    def clear(cls) -> None:
+        cls._instances = dict()
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def _get_data_signature(cls, indicator_class: Type[BandIndicatorBase]) -> Union[tuple, None]:
+        # Cache files of the data source (see DataSourceCache.get_signature), data loaded by the indicator itself
+        if indicator_class.data_source_class is None:
+            return None
+
+        return DataSourceCache.get_signature(indicator_class.data_source_class())
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        return {'instances': len(cls._instances), 'hits': cls.hits, 'misses': cls.misses}
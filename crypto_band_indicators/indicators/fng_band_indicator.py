@@ -13,12 +13,13 @@ class FngBandIndicator(BandIndicatorBase):
     _band_names=      ["Extreme Fear", "Fear",    "Neutral", "Greed",   "Extreme Greed"]
     _band_colors=     ["#C05840",      "#FC9A24", "#E5C769", "#B4E168", "#5CBC3C"]  # https://colordesigner.io/gradient-generator/?mode=rgb#DE2121-21DE21
     _band_multipliers=[1.5,            1.25,      1,         0.75,      0.5]
+    data_source_class = FngDataSource
     def __init__(self, ta_config: Union[dict, None] = None, indicator_start_date: Union[str, date, datetime, None] = None, **kvargs):
         super().__init__(**kvargs)
 
         # load indicator data if not passed
         if not isinstance(self.data, pd.DataFrame):
-            data_source = FngDataSource().load()
+            data_source = self.data_source_class().load()
 
             # add technical analysis column and use it instead of default data column
             if ta_config is not None and ta_config.get('kind') is not None:
@@ -33,26 +34,53 @@ class FngBandIndicator(BandIndicatorBase):
             print(f"[error] {error_message}")
             raise Exception(error_message)
 
+        self._build_date_index()
+
+        # Band index of every row, calculated in one vectorized pass
+        self.band_index = self._calculate_band_index(self.data[self.data_column].to_numpy())
+
     def get_band_at(self, at_date: Union[str, date, datetime, None] = None, **kvargs) -> Union[int, None]:
-        value_at = self.get_value_at(at_date=at_date)
+        if not isinstance(self.data, pd.DataFrame) or self.data.empty:
+            print(f"[warn] FngBandIndicator.get_band_at: No indicator data available")
+            return None
 
-        if (value_at is None or value_at < 0 or value_at > 100):
+        try:
+            row_at = self._get_row_at(utils.parse_any_date(at_date))
+        except IndexError as e:
+            print(
+                f"[warn] FngBandIndicator.get_band_at: Data not found, {str(e)}")
             return None
 
-        # Get index
-        band_index_at = 0
-        if (0 <= value_at < self._band_thresholds[0]):
-            band_index_at = 0
-        elif (self._band_thresholds[0] <= value_at < self._band_thresholds[1]):
-            band_index_at = 1
-        elif (self._band_thresholds[1] <= value_at <= self._band_thresholds[2]):
-            band_index_at = 2
-        elif (self._band_thresholds[2] < value_at <= self._band_thresholds[3]):
-            band_index_at = 3
-        elif (self._band_thresholds[3] < value_at <= self._band_thresholds[4]):
-            band_index_at = 4
-
-        return band_index_at
+        band_index_at = int(self.band_index[row_at])
+
+        return band_index_at if band_index_at >= 0 else None
+
+    def get_band_index_array(self, prices: Union[np.ndarray, pd.Series, None] = None, at_dates: Union[pd.DatetimeIndex, None] = None, **kvargs) -> np.ndarray:
+        # prices are not used: the band only depends on the FnG index of the date
+        if at_dates is None:
+            # read-only view of the band index of every row
+            band_index = self.band_index.view()
+            band_index.flags.writeable = False
+            return band_index
+
+        # -1 for dates out of the indicator data
+        rows_at = self._get_rows_at(at_dates)
+        return np.where(rows_at >= 0, self.band_index[rows_at], -1).astype(np.int8)
+
+    def _calculate_band_index(self, values: np.ndarray) -> np.ndarray:
+        # Same band edges as the original if/elif ladder: values are truncated to int (as get_value_at does)
+        # and everything out of [0, 100] (or NaN) gets -1
+        values = np.trunc(np.asarray(values, dtype=float))
+        thresholds = self._band_thresholds
+        band_conditions = [
+            (0 <= values) & (values < thresholds[0]),
+            (thresholds[0] <= values) & (values < thresholds[1]),
+            (thresholds[1] <= values) & (values <= thresholds[2]),
+            (thresholds[2] < values) & (values <= thresholds[3]),
+            (thresholds[3] < values) & (values <= thresholds[4]),
+        ]
+
+        return np.select(band_conditions, range(len(band_conditions)), default=-1).astype(np.int8)
 
     def get_band_details_at(self, at_date: Union[str, date, datetime, None] = None, **kvargs) -> Union[BandDetails, None]:
         band_index = self.get_band_at(at_date=at_date)
@@ -74,18 +102,14 @@ class FngBandIndicator(BandIndicatorBase):
             print(f"[warn] FngBandIndicator.get_value_at: No indicator data available")
             return None
 
-        at_date = utils.parse_any_date(at_date)
-        if not at_date:
-            at_date = self.data.index.max().date()
-
-        value_serie_at = self.data[self.data.index == pd.to_datetime(
-            at_date)]
-        if (value_serie_at.empty):
+        try:
+            row_at = self._get_row_at(utils.parse_any_date(at_date))
+        except IndexError as e:
             print(
-                f"[warn] FngBandIndicator.get_value_at: Data not found at date {at_date}")
+                f"[warn] FngBandIndicator.get_value_at: Data not found, {str(e)}")
             return None
 
-        value_at = int(value_serie_at[self.data_column])
+        value_at = int(self.data[self.data_column].iat[row_at])
 
         return value_at
 
@@ -1,19 +1,73 @@
-from typing import Union
+from typing import List, Union
 from datetime import datetime, date
+import os
+import json
+import hashlib
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from scipy.optimize import curve_fit
+from wrapt import synchronized
 from ..datas import TickerDataSource
 from .. import utils
 from .band_indicator_base import BandIndicatorBase, BandDetails
 
 _FITTED_BAND_LOG_MULTIPLIER = .455
 
+# Fitted parameters stored next to the ticker cache
+_FIT_CACHE_FILE_PATH = f"{os.path.splitext(TickerDataSource.cache_file_path)[0]}_rainbow_fit.json"
+_FIT_CACHE_MAX_ENTRIES = 64     # fits kept (last written), ie: one per indicator_start_date of walk-forward runs
+
 def _rainbow_logarithmic_function(x, a, b, c):
         return a*np.log(b+x) + c
 
+def _get_fit_fingerprint(ydata: np.ndarray, fit_key: str) -> str:
+    fingerprint = hashlib.sha1(ydata.tobytes())
+    fingerprint.update(fit_key.encode())
+    return fingerprint.hexdigest()
+
+@synchronized
+def _fit_rainbow_curve(xdata: np.ndarray, ydata: np.ndarray, ticker_symbol: str, data_column: str, start_date: datetime) -> np.ndarray:
+    # One fit per ticker, data column and start date. Reuse it if the data didn't change, or use it as
+    # initial guess if the data only has new days appended
+    fit_key = f"{ticker_symbol}|{data_column}|{start_date:%Y-%m-%d}"
+    fingerprint = _get_fit_fingerprint(ydata, fit_key)
+    p0 = None
+
+    try:
+        with open(_FIT_CACHE_FILE_PATH) as fit_cache_file:
+            fit_cache = json.load(fit_cache_file)
+    except Exception:
+        fit_cache = dict()
+
+    cached_fit = fit_cache.get(fit_key)
+    if cached_fit is not None:
+        if cached_fit['length'] == len(ydata) and cached_fit['fingerprint'] == fingerprint:
+            return np.array(cached_fit['popt'])
+        elif cached_fit['length'] < len(ydata) and cached_fit['fingerprint'] == _get_fit_fingerprint(ydata[:cached_fit['length']], fit_key):
+            p0 = cached_fit['popt']
+
+    popt, pcov = curve_fit(
+        _rainbow_logarithmic_function, xdata, ydata, p0=p0)
+
+    # Last written fit at the end, the oldest ones are evicted
+    fit_cache.pop(fit_key, None)
+    fit_cache[fit_key] = {'length': len(ydata), 'fingerprint': fingerprint, 'popt': popt.tolist()}
+    for evicted_fit_key in list(fit_cache.keys())[:-_FIT_CACHE_MAX_ENTRIES]:
+        del fit_cache[evicted_fit_key]
+
+    def write_fit_cache(file_path: str) -> None:
+        with open(file_path, 'w') as fit_cache_file:
+            json.dump(fit_cache, fit_cache_file)
+
+    try:
+        utils.write_file_atomically(_FIT_CACHE_FILE_PATH, write_fit_cache)
+    except Exception as e:
+        print(f"[warn] RainbowBandIndicator: Error writing fit cache. {str(e)}")
+
+    return popt
+
 class RainbowBandIndicator(BandIndicatorBase):
     _band_thresholds= []
     _band_names=      ["Maximum bubble!!", "Sell, seriouly sell!", "FOMO intensifies",
@@ -22,14 +76,17 @@ class RainbowBandIndicator(BandIndicatorBase):
                          '#c0de9a', '#feed94', '#f8c37d', '#f1975e', '#df6a4d', '#cf463f']
     _band_multipliers=[0, 0.1, 0.2, 0.35, 0.5, 0.75, 1, 2.5, 3]
     _band_multipliers_fibonacci=[0, 0.1, 0.2, 0.3, 0.5, 0.8, 1.3, 2.1, 3.4]
+    _band_edge_offsets=np.arange(-3, 7)    # band edges: fitted curve + offset * fitted_multiplier (log scale)
+    data_source_class = TickerDataSource
     def __init__(self, indicator_start_date: Union[str, date, datetime, None] = None, binance_api_key: str = '', binance_secret_key: str = '', fitted_multiplier: float = _FITTED_BAND_LOG_MULTIPLIER, **kvargs):
         super().__init__(**kvargs)
         self.binance_api_key = binance_api_key
         self.binance_secret_key = binance_secret_key
+        self.fitted_multiplier = fitted_multiplier
 
         # load indicator data if not passed
         if not isinstance(self.data, pd.DataFrame):
-            data_source = TickerDataSource().load()
+            data_source = self.data_source_class().load()
             self.data = data_source.to_dataframe(start=indicator_start_date)
 
         if not isinstance(self.data, pd.DataFrame) or self.data.empty:
@@ -41,19 +98,17 @@ class RainbowBandIndicator(BandIndicatorBase):
         # calculate fitted data columns
         # getting your x and y data from the dataframe
         xdata = np.array([x + 1 for x in range(len(self.data))])
-        ydata = np.log(self.data[self.data_column])
+        ydata = np.log(self.data[self.data_column].to_numpy(dtype=float))
         # here we ar fitting the curve, you can use 2 data points however I wasn't able to get a graph that looked as good with just 2 points.
         # p0=[10, 100, 90], p0 is justa guess, doesn't matter as far as I know
-        popt, pcov = curve_fit(
-            _rainbow_logarithmic_function, xdata, ydata)
+        popt = _fit_rainbow_curve(xdata, ydata, self.ticker_symbol, self.data_column, self.data.index[0])
         
-        # This is our fitted data, remember we will need to get the ex of it to graph it
+        # This is our fitted data, remember we will need to get the ex of it to graph it.
+        # Band edges are derived from it on demand (see get_band_edges), data is not modified
         self.fittedYData = _rainbow_logarithmic_function(
             xdata, popt[0], popt[1], popt[2])
-        # Add columns with rainbow coordenates
-        for i in range(-3, 7):
-            self.data[f"fitted_data{i}"] = np.exp(
-                self.fittedYData + i * fitted_multiplier)
+
+        self._build_date_index()
 
 
     def _get_current_ticker_market_price(self) -> Union[float, None]:
@@ -72,57 +127,86 @@ class RainbowBandIndicator(BandIndicatorBase):
         if price is None:
             price = self._get_current_ticker_market_price()
 
-        at_date = utils.parse_any_date(at_date)
-        if not at_date:
-            at_date = self.data.index.max().date()
-
-        rainbow_serie_at = self.data[self.data.index == pd.to_datetime(
-            at_date)]
-        if (rainbow_serie_at.empty):
+        try:
+            row_at = self._get_row_at(utils.parse_any_date(at_date))
+        except IndexError as e:
             print(
-                f"[warn] RainbowBandIndicator.get_band_at: Data not found at date {at_date}")
+                f"[warn] RainbowBandIndicator.get_band_at: Data not found, {str(e)}")
             return None
 
-        # Search for the band index
-        band_index_at = -1
-        # Fire sale!!
-        if price < float(rainbow_serie_at["fitted_data-2"]):
-            band_index_at = 8
+        band_index_at = self._calculate_band_index(
+            np.array([price], dtype=float), self._get_log_band_edges(slice(row_at, row_at + 1)))
 
-        # Buy!
-        elif price > float(rainbow_serie_at["fitted_data-2"]) and price <= float(rainbow_serie_at["fitted_data-1"]):
-            band_index_at = 7
+        return int(band_index_at[0])
 
-        # Accumulate
-        elif price > float(rainbow_serie_at["fitted_data-1"]) and price <= float(rainbow_serie_at["fitted_data0"]):
-            band_index_at = 6
+    def get_band_index_array(self, prices: Union[np.ndarray, pd.Series], at_dates: Union[pd.DatetimeIndex, None] = None, fitted_multiplier: Union[float, None] = None, **kvargs) -> np.ndarray:
+        prices = np.asarray(prices, dtype=float)
 
-        # Still cheap
-        elif price > float(rainbow_serie_at["fitted_data0"]) and price <= float(rainbow_serie_at["fitted_data1"]):
-            band_index_at = 5
+        if at_dates is None:
+            # prices aligned to the indicator data
+            return self._calculate_band_index(prices, self._get_log_band_edges(fitted_multiplier=fitted_multiplier))
 
-        # HODL
-        elif price > float(rainbow_serie_at["fitted_data1"]) and price <= float(rainbow_serie_at["fitted_data2"]):
-            band_index_at = 4
+        # -1 for dates out of the indicator data
+        rows_at = self._get_rows_at(at_dates)
+        band_index = self._calculate_band_index(prices, self._get_log_band_edges(rows_at, fitted_multiplier))
+        band_index[rows_at < 0] = -1
 
-        # Is this a bubble?
-        elif price > float(rainbow_serie_at["fitted_data2"]) and price <= float(rainbow_serie_at["fitted_data3"]):
-            band_index_at = 3
+        return band_index
 
-        # FOMO intensifies
-        elif price > float(rainbow_serie_at["fitted_data3"]) and price <= float(rainbow_serie_at["fitted_data4"]):
-            band_index_at = 2
+    def get_band_index_matrix(self, fitted_multipliers: Union[List[float], np.ndarray], prices: Union[np.ndarray, pd.Series, None] = None, at_dates: Union[pd.DatetimeIndex, None] = None) -> np.ndarray:
+        """
+        Band indexes for several fitted_multiplier values in one pass, with the curve fitted once (ie: to tune the band width)
+        :param fitted_multipliers: distances between band edges in log scale
+        :param prices: prices to classify (the data column of the indicator if None)
+        :param at_dates: dates of the prices (the indicator data dates if None)
+        :returns: (fitted_multipliers x prices) int8 matrix, every row as get_band_index_array with that fitted_multiplier
+        """
+        fitted_multipliers = np.asarray(fitted_multipliers, dtype=float)
+        prices = self.data[self.data_column].to_numpy(dtype=float) if prices is None else np.asarray(prices, dtype=float)
 
-        # Sell, seriouly sell!
-        elif price > float(rainbow_serie_at["fitted_data4"]) and price <= float(rainbow_serie_at["fitted_data5"]):
-            band_index_at = 1
+        # Log band edges broadcasted to (fitted_multipliers x prices x 10)
+        rows_at = self._get_rows_at(at_dates) if at_dates is not None else None
+        band_index = self._calculate_band_index(prices, self._get_log_band_edges(rows_at, fitted_multipliers[:, np.newaxis, np.newaxis]))
 
-        # Maximum bubble!!
-        else:
-            band_index_at = 0
+        # -1 for dates out of the indicator data
+        if rows_at is not None:
+            band_index[:, rows_at < 0] = -1
+
+        return band_index
+
+    def get_band_edges(self, rows: Union[np.ndarray, slice, None] = None, fitted_multiplier: Union[float, None] = None) -> np.ndarray:
+        """
+        Band edges (prices) of the indicator rows: fitted_data-3 .. fitted_data6
+        :param rows: row indexes, boolean mask or slice of the indicator data (all rows if None)
+        :param fitted_multiplier: distance between band edges in log scale (the indicator one if None)
+        :returns: (rows x 10) matrix, ascending in every row
+        """
+        return np.exp(self._get_log_band_edges(rows, fitted_multiplier))
+
+    def _get_log_band_edges(self, rows: Union[np.ndarray, slice, None] = None, fitted_multiplier: Union[float, np.ndarray, None] = None) -> np.ndarray:
+        # (rows x 10), or (fitted_multipliers x rows x 10) if fitted_multiplier is a (fitted_multipliers x 1 x 1) array
+        fitted_y_data = self.fittedYData if rows is None else self.fittedYData[rows]
+        fitted_multiplier = self.fitted_multiplier if fitted_multiplier is None else fitted_multiplier
+
+        return fitted_y_data[:, np.newaxis] + self._band_edge_offsets * fitted_multiplier
+
+    def _calculate_band_index(self, prices: np.ndarray, log_band_edges: np.ndarray) -> np.ndarray:
+        # Prices compared in log scale (no exp of the edges), prices <= 0 are below every edge
+        with np.errstate(divide='ignore'):
+            log_prices = np.log(np.maximum(prices, 0))
+
+        # Band edges compared in the original branches: fitted_data-2 .. fitted_data5
+        compared_edges = log_band_edges[..., 1:9]
+
+        # Every edge below the price moves it one band up (from 8: Fire sale!! to 0: Maximum bubble!!)
+        band_index = len(self._band_names) - 1 - \
+            (compared_edges < log_prices[:, np.newaxis]).sum(axis=-1)
+
+        # A price equal to fitted_data-2 (or NaN) doesn't match any branch and falls to Maximum bubble!!
+        band_index[(log_prices == compared_edges[..., 0]) | np.isnan(prices)] = 0
+
+        return band_index.astype(np.int8)
 
-        return band_index_at
-    
     def get_band_details_at(self, price: float = None, at_date: Union[str, date, datetime, None] = None) -> Union[BandDetails, None]:
         band_index = self.get_band_at(price=price, at_date=at_date) 
         
@@ -140,15 +224,16 @@ class RainbowBandIndicator(BandIndicatorBase):
 
     
     def plot_axes(self, axes, start=None, end=None):
-        plot_data = self.data
         plot_data_column = self._default_column
 
+        plot_rows = np.ones(len(self.data), dtype=bool)
         if start is not None:
-            plot_data = plot_data[plot_data.index >= start]
+            plot_rows &= self.data.index >= start
         if end is not None:
-            plot_data = plot_data[plot_data.index <= end]
+            plot_rows &= self.data.index <= end
 
-        latest_serie = plot_data.iloc[-1]
+        plot_data = self.data[plot_rows]
+        band_edges = self.get_band_edges(plot_rows)
 
         # Draw bitcoin price
         axes.semilogy(
@@ -157,10 +242,10 @@ class RainbowBandIndicator(BandIndicatorBase):
         # Draw the rainbow bands
         for i in range(-2, 7):
             # You can use the below plot fill between rather than the above line plot, I prefer the line graph
-            axes.fill_between(plot_data.index, plot_data[f"fitted_data{i-1}"],
-                              plot_data[f"fitted_data{i}"], alpha=0.8, linewidth=1, color=self._band_colors[i+2])
+            axes.fill_between(plot_data.index, band_edges[:, i+2],
+                              band_edges[:, i+3], alpha=0.8, linewidth=1, color=self._band_colors[i+2])
             axes.plot(plot_data.index,
-                      plot_data[f"fitted_data{i}"], linewidth=1, color=self._band_colors[i+2])
+                      band_edges[:, i+3], linewidth=1, color=self._band_colors[i+2])
 
         # yticks
         axes.tick_params(axis='y', labelsize='x-small')
@@ -168,10 +253,8 @@ class RainbowBandIndicator(BandIndicatorBase):
         # Add yticks on the right
         band_axis = axes.secondary_yaxis("right")
 
-        rainbow_band_yticks = list()
-        for i in range(-3, 7):
-            # print(f"fitted_data{i}: ", latest_serie[f"fitted_data{i}"])
-            rainbow_band_yticks.append(latest_serie[f"fitted_data{i}"])
+        # Band edges of the latest row
+        rainbow_band_yticks = list(band_edges[-1])
         band_axis.set_yticks(rainbow_band_yticks)
         band_axis.set_yticklabels(
             [f"{rainbow_band_ytick:.2f}" for rainbow_band_ytick in rainbow_band_yticks])
@@ -190,7 +273,7 @@ class RainbowBandIndicator(BandIndicatorBase):
             print(f"[warn] plot_rainbow: No historical data available")
             return None
 
-        latest_serie = self.data.iloc[-1]
+        band_edges = self.get_band_edges()
 
         fig, axes = plt.subplots()
         fig.suptitle('Bitcoin Rainbow Chart', fontsize='large')
@@ -205,10 +288,10 @@ class RainbowBandIndicator(BandIndicatorBase):
         # Draw the rainbow bands
         for i in range(-2, 7):
             # You can use the below plot fill between rather than the above line plot, I prefer the line graph
-            axes.fill_between(self.data.index, self.data[f"fitted_data{i-1}"],
-                              self.data[f"fitted_data{i}"], alpha=0.8, linewidth=1, color=self._band_colors[i+2])
+            axes.fill_between(self.data.index, band_edges[:, i+2],
+                              band_edges[:, i+3], alpha=0.8, linewidth=1, color=self._band_colors[i+2])
             axes.plot(self.data.index,
-                      self.data[f"fitted_data{i}"], linewidth=1.5, markersize=0.5, color=self._band_colors[i+2])
+                      band_edges[:, i+3], linewidth=1.5, markersize=0.5, color=self._band_colors[i+2])
 
         axes.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
 
@@ -224,10 +307,8 @@ class RainbowBandIndicator(BandIndicatorBase):
         # Add yticks on the right
         band_axis = axes.secondary_yaxis("right")
 
-        rainbow_band_yticks = list()
-        for i in range(-3, 7):
-            # print(f"fitted_data{i}: ", latest_serie[f"fitted_data{i}"])
-            rainbow_band_yticks.append(latest_serie[f"fitted_data{i}"])
+        # Band edges of the latest row
+        rainbow_band_yticks = list(band_edges[-1])
         band_axis.set_yticks(rainbow_band_yticks)
         band_axis.set_yticklabels(
             [f"{rainbow_band_ytick:.2f}" for rainbow_band_ytick in rainbow_band_yticks])
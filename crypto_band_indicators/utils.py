@@ -1,5 +1,8 @@
-from typing import Union
+from typing import Callable, Union
 from datetime import datetime, date, time
+import os
+import tempfile
+import numpy as np
 
 
 class LogColors:
@@ -44,6 +47,8 @@ def parse_any_date(date_any: Union[str, date, None] = None, default_date: any =
         except:
             print(
                 f"[warn] parse_date: invalid date {date_any} doesn't look like '%d/%m/%Y'")
+    elif isinstance(date_any, datetime):
+        return date_any
     elif isinstance(date_any, date):
         return datetime.combine(date_any, time(0, 0, 0))
 
@@ -58,3 +63,45 @@ def parse_any_date(date_any: Union[str, date, None] = None, default_date: any =
         return datetime.combine(default_date, time(0, 0, 0))
 
     return default_date
+
+
+def get_day_offsets(dates: any, first_date: any) -> np.ndarray:
+    # integer number of days between first_date and dates (scalar or array-like)
+    return (np.asarray(dates, dtype='datetime64[D]') - np.datetime64(first_date, 'D')).astype(np.int64)
+
+
+def get_granularity_timedelta(granularity: str) -> np.timedelta64:
+    # bar size of a granularity (Binance interval names): '1m', '15m', '1h', '4h', '1d', '1w'...
+    units = {'m': 'm', 'h': 'h', 'd': 'D', 'w': 'W'}
+    if not isinstance(granularity, str) or granularity[-1:] not in units or not granularity[:-1].isdigit():
+        raise Exception(f"invalid granularity {granularity}. Expected a number and a unit (m, h, d, w). Ex: '1h'")
+
+    return np.timedelta64(int(granularity[:-1]), units[granularity[-1]]).astype('timedelta64[ns]')
+
+
+def get_bar_offsets(dates: any, first_date: any, bar_timedelta: np.timedelta64) -> np.ndarray:
+    # integer number of bars between first_date and dates (scalar or array-like)
+    return (np.asarray(dates, dtype='datetime64[ns]') - np.datetime64(first_date, 'ns')) // bar_timedelta
+
+
+def write_file_atomically(file_path: str, write_function: Callable[[str], None], exclusive: bool = False) -> None:
+    """
+    Write a file through a unique temporary file in the same directory, renamed once written: readers and
+    concurrent writers (ie: other processes) never see a partially written file
+    :param file_path: file to write
+    :param write_function: function writing the content in the temporary file path it receives
+    :param exclusive: raise FileExistsError if file_path exists instead of replacing it
+    """
+    file_descriptor, temporary_file_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(file_path)}.", suffix='.tmp', dir=os.path.dirname(os.path.abspath(file_path)))
+    os.close(file_descriptor)
+
+    try:
+        write_function(temporary_file_path)
+        if exclusive:
+            os.link(temporary_file_path, file_path)
+        else:
+            os.replace(temporary_file_path, file_path)
+    finally:
+        if os.path.exists(temporary_file_path):
+            os.remove(temporary_file_path)
@@ -0,0 +1,100 @@
+import os
+import tempfile
+from timeit import timeit
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from crypto_band_indicators.datas import DataSourceBase, FngDataSource
+from tabulate import tabulate
+
+# Variables #########################
+years = 10                 # years of daily data in the benchmark caches
+repeat = 20                # number of loads to average
+
+# Enable / diable parts to bo tested
+run_cache_format_benchmark = True
+run_fng_ingestion_benchmark = True
+run_compact_dtypes_benchmark = True
+
+
+class BenchmarkDataSource(DataSourceBase):
+    index_column = 'date'
+    numeric_columns = ['close']
+    compact_dtypes = FngDataSource.compact_dtypes
+
+
+def get_benchmark_dataframe(length: int) -> pd.DataFrame:
+    dates = pd.date_range('2010-01-01', periods=length, name='date')
+    close = np.random.default_rng(0).uniform(0, 100, length).round()
+    close_name = np.array(['Extreme Fear', 'Fear', 'Neutral', 'Greed', 'Extreme Greed'])[(close // 20.01).astype(int)]
+    return pd.DataFrame({'close': close, 'close_name': close_name}, index=dates)
+
+
+def cache_format_benchmark():
+    results = list()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        data_source = BenchmarkDataSource()
+        data_source.cache_file_path = os.path.join(cache_dir, 'benchmark.csv')
+        data_source.dataframe = get_benchmark_dataframe(years * 365)
+
+        for cache_format in ['csv', 'npz']:
+            data_source.cache_format = cache_format
+            data_source.write_cache()
+
+            load_seconds = timeit(data_source.read_cache, number=repeat) / repeat
+            file_size = os.path.getsize(data_source.get_cache_file_path())
+            results.append([cache_format, load_seconds * 1000, file_size / 1024])
+
+    print(f"\nCold load of {years} years of daily data")
+    print(tabulate(results, headers=['Format', 'Load ms', 'KB read'], tablefmt="fancy_grid", floatfmt=".2f"))
+
+
+def get_benchmark_fng_response(length: int) -> list:
+    timestamps = np.arange(length)[::-1] * 86400 + 1262304000
+    values = np.random.default_rng(0).integers(1, 100, length)
+    return [{'value': str(value), 'value_classification': 'Neutral', 'timestamp': str(timestamp), 'time_until_update': ''}
+            for value, timestamp in zip(values, timestamps)]
+
+
+def parse_fng_history_per_row(fng_response: list) -> pd.DataFrame:
+    # Previous ingestion (one python call per row), as reference
+    data = pd.DataFrame(fng_response, columns=['timestamp', 'value', 'value_classification'])
+    data = data.rename(columns={'timestamp': 'date', 'value': 'close', 'value_classification': 'close_name'})
+    data['date'] = pd.to_datetime(data['date'].apply(lambda x: datetime.fromtimestamp(int(x)).date()))
+    data['close'] = pd.to_numeric(data['close'], errors='raise')
+    data = data[data["close"] > 0]
+    return data.set_index('date', drop=True)
+
+
+def fng_ingestion_benchmark():
+    fng_response = get_benchmark_fng_response(years * 365)
+
+    results = list()
+    for name, parse_function in [('per row (previous)', parse_fng_history_per_row),
+                                 ('parse_fng_history', FngDataSource.parse_fng_history)]:
+        parse_seconds = timeit(lambda: parse_function(fng_response), number=repeat) / repeat
+        results.append([name, parse_seconds * 1000, len(fng_response) / parse_seconds])
+
+    print(f"\nIngestion of {len(fng_response)} FnG rows")
+    print(tabulate(results, headers=['Path', 'Parse ms', 'Rows / s'], tablefmt="fancy_grid", floatfmt=".2f"))
+
+
+def compact_dtypes_benchmark():
+    data_source = BenchmarkDataSource()
+    data_source.dataframe = get_benchmark_dataframe(years * 365)
+
+    memory_usage = data_source.compact()
+    results = [[f"{column}", f"{dtype}"] for column, dtype in data_source.dataframe.dtypes.items()]
+
+    print(f"\nCompact dtypes of {len(data_source.dataframe)} FnG rows: {memory_usage['before'] / 1024:.2f} KB -> {memory_usage['after'] / 1024:.2f} KB")
+    print(tabulate(results, headers=['Column', 'Dtype'], tablefmt="fancy_grid"))
+
+
+if __name__ == '__main__':
+    if run_cache_format_benchmark:
+        cache_format_benchmark()
+    if run_fng_ingestion_benchmark:
+        fng_ingestion_benchmark()
+    if run_compact_dtypes_benchmark:
+        compact_dtypes_benchmark()
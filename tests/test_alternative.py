@@ -0,0 +1,92 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from crypto_band_indicators import config
+from crypto_band_indicators.datas import alternative
+
+# Stub of the alternative.me API: fails with 503 the first {failures} requests, then serves fng_data with an ETag
+fng_data = [
+    {'value': '40', 'value_classification': 'Fear', 'timestamp': '1640995200'},
+    {'value': '30', 'value_classification': 'Fear', 'timestamp': '1640908800'},
+]
+
+
+class StubAlternativeHandler(BaseHTTPRequestHandler):
+    failures = 0
+    requests = list()
+
+    def do_GET(self):
+        StubAlternativeHandler.requests.append(dict(self.headers))
+
+        if StubAlternativeHandler.failures > 0:
+            StubAlternativeHandler.failures -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        if self.headers.get('If-None-Match') == '"fng-v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps({'name': 'Fear and Greed Index', 'data': fng_data, 'metadata': {'error': None}}).encode()
+        self.send_response(200)
+        self.send_header('ETag', '"fng-v1"')
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_alternative_api():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubAlternativeHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    previous_url = config.get(config.ALTERNATIVE_API_URL)
+    previous_backoff_factor = config.get(config.HTTP_BACKOFF_FACTOR)
+    config.set(config.ALTERNATIVE_API_URL, f"http://127.0.0.1:{server.server_port}")
+    config.set(config.HTTP_BACKOFF_FACTOR, 0.01)
+    StubAlternativeHandler.failures = 0
+    StubAlternativeHandler.requests = list()
+    alternative._last_responses.clear()
+
+    yield StubAlternativeHandler
+
+    config.set(config.ALTERNATIVE_API_URL, previous_url)
+    config.set(config.HTTP_BACKOFF_FACTOR, previous_backoff_factor)
+    server.shutdown()
+
+
+def test_get_fng_history(stub_alternative_api):
+    fng_list = alternative.get_fng_history(limit=2)
+
+    assert [fng['value'] for fng in fng_list] == ['30', '40']
+
+
+def test_retries_on_server_errors(stub_alternative_api):
+    stub_alternative_api.failures = 2
+
+    fng_list = alternative.get_fng_history(limit=2)
+
+    assert len(stub_alternative_api.requests) == 3
+    assert len(fng_list) == 2
+
+
+def test_gives_up_after_max_retries(stub_alternative_api):
+    stub_alternative_api.failures = config.get(config.HTTP_MAX_RETRIES) + 1
+
+    assert alternative.get_fng_history(limit=2) is None
+    assert len(stub_alternative_api.requests) == config.get(config.HTTP_MAX_RETRIES) + 1
+
+
+def test_conditional_request_reuses_last_response(stub_alternative_api):
+    first_fng_list = alternative.get_fng_history(limit=2)
+    second_fng_list = alternative.get_fng_history(limit=2)
+
+    assert stub_alternative_api.requests[-1].get('If-None-Match') == '"fng-v1"'
+    assert second_fng_list == first_fng_list
@@ -1,6 +1,6 @@
 import backtrader as bt
 from crypto_band_indicators.backtrader import RebalanceStrategy, WeightedDCAStrategy, DCAStrategy, HodlStrategy
-from crypto_band_indicators.datas import TickerDataSource, FngDataSource
+from crypto_band_indicators.datas import TickerDataSource, FngDataSource, DataSourceRegistry
 from crypto_band_indicators.indicators import FngBandIndicator, RainbowBandIndicator
 from crypto_band_indicators import utils, config
 from tabulate import tabulate
@@ -33,9 +33,9 @@ ticker_ta_config_list = [
                         {'kind': 'sma', 'length': 3},
                         ]
 
-# Data sources
-ticker_data_source = TickerDataSource().load()
-FngDataSource().load()
+# Data sources (loaded concurrently)
+loaded_data_sources, _ = DataSourceRegistry.load_all([TickerDataSource, FngDataSource])
+ticker_data_source = loaded_data_sources[TickerDataSource]
 # Configure for optimisation
 config.set(config.ONLY_CACHE, True)
 config.set(config.DISABLE_FETCH, True)
@@ -46,7 +46,7 @@ if ticker_ta_config_list is not None:
     ta_column_list = ticker_data_source.get_ta_columns()
 
 def run(start, end, strategy_class, **kwargs):
-    cerebro = bt.Cerebro(stdstats=False, optreturn=False, maxcpus=1, runonce=True, exactbars=False)
+    cerebro = bt.Cerebro(stdstats=False, optreturn=False, maxcpus=None, runonce=True, exactbars=False)
     cerebro.broker.set_coc(True)
 
     # Add strategy
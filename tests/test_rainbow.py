@@ -1,3 +1,4 @@
+import numpy as np
 import backtrader as bt
 from crypto_band_indicators.backtrader import RebalanceStrategy, WeightedDCAStrategy
 from crypto_band_indicators.datas import TickerDataSource
@@ -28,9 +29,13 @@ indicator_ta_config = {'kind': 'wma', 'length': 3}  # Ex: {'kind': 'wma', 'lengt
 backtrader_log = True
 backtrader_debug = False
 
+# fitted_multiplier values of the band sweep (one curve fit for all of them)
+fitted_multipliers = [0.35, 0.4, 0.455, 0.5, 0.55]
+
 # Enable / diable parts to bo tested
 run_get_value_test = True
 run_plot_test = True
+run_band_sweep_test = True
 run_backtrader_test = True
 run_plot_backtrader_result_test = True
 
@@ -64,6 +69,16 @@ def plot_test():
     rainbow.plot_rainbow()
 
 
+def band_sweep_test():
+    # Band index of every date for each fitted_multiplier
+    band_index_matrix = rainbow.get_band_index_matrix(fitted_multipliers)
+
+    print("Rainbow bands (days per band) by fitted_multiplier:")
+    for fitted_multiplier, band_index in zip(fitted_multipliers, band_index_matrix):
+        band_days = np.bincount(band_index, minlength=len(rainbow._band_names))
+        print(f"{fitted_multiplier:<6} {band_days}")
+
+
 def backtrader_test():
     # Create a cerebro entity
     cerebro = bt.Cerebro(stdstats=False)  # cheat_on_open=True, broker_coo=True
@@ -131,5 +146,7 @@ if __name__ == '__main__':
         get_value_test()
     if run_plot_test == True:
         plot_test()
+    if run_band_sweep_test:
+        band_sweep_test()
     if run_backtrader_test:
         backtrader_test()